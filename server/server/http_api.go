@@ -415,6 +415,8 @@ func installHTTPAPI() {
     http.HandleFunc("/api/systems/overview", serveSystemOverview)
     http.HandleFunc("/api/analytics/kpis", serveKPI)
     http.HandleFunc("/api/analytics/historical", serveKPIHistorical)
+    http.HandleFunc("/api/analytics/dashboard", serveDashboard)
+    http.HandleFunc("/api/analytics/stream", serveKPIStream)
     http.HandleFunc("/api/simulation/whatif", serveWhatIf)
     http.HandleFunc("/api/simulation/restart", serveSimulationRestart)
     http.HandleFunc("/api/ai/hints", serveAIHints)
@@ -12,7 +12,13 @@ import (
 // GET /api/analytics/kpis
 func serveKPI(w http.ResponseWriter, r *http.Request) {
     if r.Method != http.MethodGet { http.Error(w, "Method not allowed", http.StatusMethodNotAllowed); return }
-    rangeParam := r.URL.Query().Get("timeRange")
+    resp := kpiResponse(r.URL.Query().Get("timeRange"))
+    w.Header().Set("Content-Type", "application/json; charset=utf-8")
+    _ = json.NewEncoder(w).Encode(resp)
+}
+
+// kpiResponse builds the KPI snapshot and trends for a time range.
+func kpiResponse(rangeParam string) map[string]interface{} {
     var dur time.Duration
     switch rangeParam {
     case "1h": dur = time.Hour
@@ -52,8 +58,7 @@ func serveKPI(w http.ResponseWriter, r *http.Request) {
             "headwayAdherence": map[string]interface{}{"change": trend.headwayAdherence, "direction": trendDirection(trend.headwayAdherence)},
         },
     }
-    w.Header().Set("Content-Type", "application/json; charset=utf-8")
-    _ = json.NewEncoder(w).Encode(resp)
+    return resp
 }
 
 func trendDirection(v float64) string { if v >= 0 { return "UP" }; return "DOWN" }
@@ -69,6 +74,27 @@ func serveKPIHistorical(w http.ResponseWriter, r *http.Request) {
     metrics.mu.RLock()
     snaps := append([]kpiSnapshot{}, metrics.snapshots...)
     metrics.mu.RUnlock()
+    var resp map[string]interface{}
+    if list := r.URL.Query().Get("metrics"); list != "" {
+        // Batch form: one series per requested metric, from the same snapshots
+        resp = map[string]interface{}{"period": period, "metrics": historicalBatch(snaps, list)}
+    } else {
+        resp = map[string]interface{}{"metric": metric, "period": period, "series": historicalSeries(snaps, metric)}
+    }
+    w.Header().Set("Content-Type", "application/json; charset=utf-8")
+    _ = json.NewEncoder(w).Encode(resp)
+}
+
+// historicalBatch returns one series per metric of a comma separated list.
+func historicalBatch(snaps []kpiSnapshot, list string) map[string]interface{} {
+    byMetric := map[string]interface{}{}
+    for _, m := range strings.Split(list, ",") {
+        if m = strings.TrimSpace(m); m != "" { byMetric[m] = historicalSeries(snaps, m) }
+    }
+    return byMetric
+}
+
+func historicalSeries(snaps []kpiSnapshot, metric string) []map[string]interface{} {
     series := []map[string]interface{}{}
     for _, s := range snaps {
         v := 0.0
@@ -86,11 +112,68 @@ func serveKPIHistorical(w http.ResponseWriter, r *http.Request) {
         }
         series = append(series, map[string]interface{}{"t": s.ts.Format(time.RFC3339), "v": v})
     }
-    resp := map[string]interface{}{"metric": metric, "period": period, "series": series}
+    return series
+}
+
+// GET /api/analytics/dashboard
+// Everything the KPI dashboard shows in one round-trip: the /kpis response
+// for timeRange plus, under "historical", the batch /historical response
+// for metrics and period.
+func serveDashboard(w http.ResponseWriter, r *http.Request) {
+    if r.Method != http.MethodGet { http.Error(w, "Method not allowed", http.StatusMethodNotAllowed); return }
+    q := r.URL.Query()
+    period := q.Get("period")
+    if period == "" { period = "hourly" }
+    resp := kpiResponse(q.Get("timeRange"))
+    historical := map[string]interface{}{"period": period, "metrics": map[string]interface{}{}}
+    if list := q.Get("metrics"); list != "" {
+        metrics.mu.RLock()
+        snaps := append([]kpiSnapshot{}, metrics.snapshots...)
+        metrics.mu.RUnlock()
+        historical["metrics"] = historicalBatch(snaps, list)
+    }
+    resp["historical"] = historical
     w.Header().Set("Content-Type", "application/json; charset=utf-8")
     _ = json.NewEncoder(w).Encode(resp)
 }
 
+// GET /api/analytics/stream (Server-Sent Events)
+// Emits a "snapshot" event each time a new KPI snapshot has been recorded,
+// so clients refetch KPIs/historical data only when they changed.
+func serveKPIStream(w http.ResponseWriter, r *http.Request) {
+    if r.Method != http.MethodGet { http.Error(w, "Method not allowed", http.StatusMethodNotAllowed); return }
+    w.Header().Set("Content-Type", "text/event-stream")
+    w.Header().Set("Cache-Control", "no-cache")
+    w.Header().Set("Connection", "keep-alive")
+    flusher, ok := w.(http.Flusher)
+    if !ok { http.Error(w, "Streaming unsupported", http.StatusInternalServerError); return }
+    ch := subscribeSnapshots()
+    defer unsubscribeSnapshots(ch)
+    // Send a comment to establish stream
+    _, _ = w.Write([]byte(":ok\n\n"))
+    flusher.Flush()
+    // heartbeat ticker
+    ticker := time.NewTicker(25 * time.Second)
+    defer ticker.Stop()
+    enc := json.NewEncoder(w)
+    for {
+        select {
+        case ts, ok := <-ch:
+            if !ok { return }
+            _, _ = w.Write([]byte("event: snapshot\n"))
+            _, _ = w.Write([]byte("data: "))
+            _ = enc.Encode(map[string]interface{}{"timestamp": ts.Format(time.RFC3339)})
+            _, _ = w.Write([]byte("\n"))
+            flusher.Flush()
+        case <-r.Context().Done():
+            return
+        case <-ticker.C:
+            _, _ = w.Write([]byte(":hb\n\n"))
+            flusher.Flush()
+        }
+    }
+}
+
 // POST /api/simulation/whatif
 func serveWhatIf(w http.ResponseWriter, r *http.Request) {
     if r.Method != http.MethodPost { http.Error(w, "Method not allowed", http.StatusMethodNotAllowed); return }
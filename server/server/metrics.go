@@ -318,10 +318,44 @@ func startMetricsTicker() {
 		ticker := time.NewTicker(60 * time.Second)
 		for range ticker.C {
 			takeSnapshot()
+			notifySnapshot(time.Now().UTC())
 		}
 	}()
 }
 
+// snapshot listeners (analytics SSE stream)
+var snapshotSubs = struct {
+	sync.Mutex
+	chans map[chan time.Time]bool
+}{chans: make(map[chan time.Time]bool)}
+
+func subscribeSnapshots() chan time.Time {
+	ch := make(chan time.Time, 1)
+	snapshotSubs.Lock()
+	snapshotSubs.chans[ch] = true
+	snapshotSubs.Unlock()
+	return ch
+}
+
+func unsubscribeSnapshots(ch chan time.Time) {
+	snapshotSubs.Lock()
+	delete(snapshotSubs.chans, ch)
+	snapshotSubs.Unlock()
+	close(ch)
+}
+
+func notifySnapshot(ts time.Time) {
+	snapshotSubs.Lock()
+	defer snapshotSubs.Unlock()
+	for ch := range snapshotSubs.chans {
+		select {
+		case ch <- ts:
+		default:
+			// subscriber has not consumed the previous one yet
+		}
+	}
+}
+
 func aggregateKPIs(rangeDur time.Duration) (kpiSnapshot, kpiSnapshot) {
 	metrics.mu.RLock()
 	defer metrics.mu.RUnlock()
@@ -19,6 +19,7 @@
 #
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import time
 import json
@@ -29,7 +30,8 @@ from Qt import QtCore
 class KPIDataProvider(QtCore.QObject):
     """Asynchronous provider for fetching KPI analytics from server API.
 
-    This class uses background threads (Python threading) to avoid blocking the UI.
+    Requests run on a small pool of long-lived worker threads sharing one
+    HTTP session, so concurrent fetches overlap and reuse connections.
     Results are emitted back on the Qt signal thread.
     """
 
@@ -40,10 +42,27 @@ class KPIDataProvider(QtCore.QObject):
         self._api_key = api_key
         self._session = requests.Session()
         self._timeout_seconds = 5
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kpi-provider")
+        # period -> (monotonic time, batch payload) of recent history fetches
+        self._hist_cache = {}
+        # Cleared when the server turns out not to have /api/analytics/dashboard
+        self._bundle_supported = True
+        self._streaming = False
+        self._stream_thread = None
+        self._stream_session = None
+        self._lock = threading.Lock()
 
     kpisUpdated = QtCore.pyqtSignal(dict)
     historicalUpdated = QtCore.pyqtSignal(str, dict)
-    errorOccurred = QtCore.pyqtSignal(str)
+    historicalBatchUpdated = QtCore.pyqtSignal(dict)
+    bundleUpdated = QtCore.pyqtSignal(dict)
+    snapshotReceived = QtCore.pyqtSignal(str)
+    streamStatusChanged = QtCore.pyqtSignal(bool)
+    # (request kind, message); kind is "kpis", "metric", "history" or "bundle"
+    errorOccurred = QtCore.pyqtSignal(str, str)
+
+    # How long a batch of historical series stays fresh, per period (seconds)
+    HISTORY_TTL = {"hourly": 60, "daily": 300, "weekly": 900}
 
     def setBaseUrl(self, base_url):
         self._base_url = base_url or self._base_url
@@ -51,10 +70,13 @@ class KPIDataProvider(QtCore.QObject):
     def setApiKey(self, api_key):
         self._api_key = api_key
 
-    def refreshKpis(self, time_range="1d"):
+    def refreshKpis(self, time_range="1d", as_of=None):
         """Fetch current KPI snapshot.
 
         :param time_range: one of ("1h","6h","1d","1w","1m")
+        :param as_of: optional epoch seconds the window ends at; callers
+        quantize it so the request URL stays identical, and therefore
+        cacheable upstream, within a bucket
         """
 
         def _run():
@@ -64,15 +86,17 @@ class KPIDataProvider(QtCore.QObject):
                     headers["X-API-Key"] = self._api_key
                 url = f"{self._base_url}/api/analytics/kpis"
                 params = {"timeRange": time_range}
+                if as_of is not None:
+                    params["asOf"] = int(as_of)
                 resp = self._session.get(url, params=params, headers=headers, timeout=self._timeout_seconds)
                 resp.raise_for_status()
                 data = resp.json()
                 # Emit from worker thread; Qt will queue to receiver thread
                 self.kpisUpdated.emit(data)
             except Exception as exc:
-                self.errorOccurred.emit(str(exc))
+                self.errorOccurred.emit("kpis", str(exc))
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._executor.submit(_run)
 
     def fetchHistorical(self, metric="rtp", period="hourly"):
         """Fetch historical series for a metric.
@@ -93,9 +117,224 @@ class KPIDataProvider(QtCore.QObject):
                 data = resp.json()
                 self.historicalUpdated.emit(metric, data)
             except Exception as exc:
-                self.errorOccurred.emit(str(exc))
+                self.errorOccurred.emit("metric", str(exc))
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._executor.submit(_run)
+
+    def fetchHistoricalBatch(self, metrics, period="hourly"):
+        """Fetch historical series for several metrics in a single request.
+
+        Emits historicalBatchUpdated with a {metric: response} mapping, each
+        response shaped like the one fetchHistorical emits. A batch fetched
+        less than HISTORY_TTL[period] seconds ago is emitted again straight
+        away instead of being requested.
+
+        :param metrics: iterable of metric names accepted by fetchHistorical
+        :param period: "hourly|daily|weekly"
+        """
+        metrics = list(metrics)
+        cached = self._hist_cache.get(period)
+        if cached is not None:
+            fetched_at, payload = cached
+            if (time.monotonic() - fetched_at < self.HISTORY_TTL.get(period, 60)
+                    and all(m in payload for m in metrics)):
+                self.historicalBatchUpdated.emit(payload)
+                return
+
+        def _run():
+            try:
+                headers = {}
+                if self._api_key:
+                    headers["X-API-Key"] = self._api_key
+                url = f"{self._base_url}/api/analytics/historical"
+                params = {"metrics": ",".join(metrics), "period": period}
+                resp = self._session.get(url, params=params, headers=headers, timeout=self._timeout_seconds)
+                resp.raise_for_status()
+                by_metric = resp.json().get("metrics")
+                if isinstance(by_metric, dict):
+                    payload = self._historicalPayload(by_metric, period)
+                else:
+                    # Server without batch support: query each metric in
+                    # turn over the same kept-alive session
+                    payload = {}
+                    for metric in metrics:
+                        params = {"metric": metric, "period": period}
+                        resp = self._session.get(url, params=params, headers=headers, timeout=self._timeout_seconds)
+                        resp.raise_for_status()
+                        payload[metric] = resp.json()
+                self._hist_cache[period] = (time.monotonic(), payload)
+                self.historicalBatchUpdated.emit(payload)
+            except Exception as exc:
+                self.errorOccurred.emit("history", str(exc))
+
+        self._executor.submit(_run)
+
+    def fetchDashboardBundle(self, time_range="1d", metrics=(), period="hourly", as_of=None):
+        """Fetch KPIs and historical series together in one request.
+
+        Emits bundleUpdated with the kpisUpdated payload plus a "historical"
+        entry shaped like the historicalBatchUpdated payload. Against a
+        server without the dashboard endpoint this falls back to
+        refreshKpis and fetchHistoricalBatch, which emit their own signals.
+        Series still fresh in the fetchHistoricalBatch cache are not asked
+        for again; only the KPIs are requested and the cached series merged in.
+
+        :param time_range: one of ("1h","6h","1d","1w","1m")
+        :param metrics: iterable of metric names accepted by fetchHistorical
+        :param period: "hourly|daily|weekly"
+        :param as_of: optional quantized epoch seconds, as for refreshKpis
+        """
+        metrics = list(metrics)
+        if not self._bundle_supported:
+            self.refreshKpis(time_range, as_of)
+            if metrics:
+                self.fetchHistoricalBatch(metrics, period)
+            return
+
+        cached_payload = None
+        cached = self._hist_cache.get(period)
+        if cached is not None:
+            fetched_at, payload = cached
+            if (time.monotonic() - fetched_at < self.HISTORY_TTL.get(period, 60)
+                    and all(m in payload for m in metrics)):
+                cached_payload = payload
+        request_metrics = metrics if cached_payload is None else []
+
+        def _run():
+            try:
+                headers = {}
+                if self._api_key:
+                    headers["X-API-Key"] = self._api_key
+                url = f"{self._base_url}/api/analytics/dashboard"
+                params = {"timeRange": time_range, "metrics": ",".join(request_metrics), "period": period}
+                if as_of is not None:
+                    params["asOf"] = int(as_of)
+                resp = self._session.get(url, params=params, headers=headers, timeout=self._timeout_seconds)
+                if resp.status_code == 404:
+                    # Older server: use the separate endpoints from now on
+                    self._bundle_supported = False
+                    self.fetchDashboardBundle(time_range, metrics, period, as_of)
+                    return
+                resp.raise_for_status()
+                data = resp.json()
+                if cached_payload is not None:
+                    data["historical"] = cached_payload
+                else:
+                    historical = data.get("historical") or {}
+                    by_metric = historical.get("metrics") or {}
+                    payload = self._historicalPayload(by_metric, period)
+                    if payload:
+                        self._hist_cache[period] = (time.monotonic(), payload)
+                    data["historical"] = payload
+                self.bundleUpdated.emit(data)
+            except Exception as exc:
+                self.errorOccurred.emit("bundle", str(exc))
+
+        self._executor.submit(_run)
+
+    @staticmethod
+    def _historicalPayload(by_metric, period):
+        """{metric: series} -> {metric: fetchHistorical-shaped response}"""
+        return {m: {"metric": m, "period": period, "series": series}
+                for m, series in by_metric.items()}
+
+    def startStream(self):
+        """Listen to the server's KPI snapshot stream (SSE).
+
+        snapshotReceived is emitted with the snapshot timestamp each time the
+        server records new KPIs; streamStatusChanged reports whether the
+        stream is connected, so callers can fall back to polling.
+        """
+        with self._lock:
+            self._streaming = True
+            if self._stream_session is None:
+                # Reused across restarts; stopStream only drops its connections
+                self._stream_session = requests.Session()
+        if not self._stream_thread or not self._stream_thread.is_alive():
+            self._stream_thread = threading.Thread(target=self._runStream, daemon=True)
+            self._stream_thread.start()
+
+    def stopStream(self):
+        """Stop the KPI snapshot stream."""
+        with self._lock:
+            self._streaming = False
+            session = self._stream_session
+        if session is not None:
+            # Closing the session should help break out of iter_lines
+            try:
+                session.close()
+            except requests.RequestException:
+                pass
+
+    def _isStreaming(self):
+        with self._lock:
+            return self._streaming
+
+    def _runStream(self):
+        """Connect to the SSE endpoint and emit incoming snapshot events."""
+        headers = {
+            "Accept": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        }
+        if self._api_key:
+            headers["X-API-Key"] = self._api_key
+
+        while self._isStreaming():
+            try:
+                url = f"{self._base_url}/api/analytics/stream"
+                with self._lock:
+                    session = self._stream_session
+                resp = session.get(url, headers=headers, stream=True, timeout=(5, 60))
+                if resp.status_code == 404:
+                    # Server without the stream: stay on polling
+                    self.streamStatusChanged.emit(False)
+                    break
+                resp.raise_for_status()
+                self.streamStatusChanged.emit(True)
+
+                event_type = None
+                data_lines = []
+                for raw_line in resp.iter_lines(decode_unicode=True):
+                    if not self._isStreaming():
+                        break
+                    if raw_line is None:
+                        continue
+                    line = raw_line.strip()
+                    if not line:
+                        # dispatch accumulated event
+                        if event_type == "snapshot" and data_lines:
+                            try:
+                                payload = json.loads("\n".join(data_lines))
+                            except ValueError:
+                                payload = None
+                            if not isinstance(payload, dict):
+                                payload = {}
+                            # New snapshot: cached history is now stale
+                            self._hist_cache = {}
+                            self.snapshotReceived.emit(str(payload.get("timestamp", "")))
+                        event_type = None
+                        data_lines = []
+                        continue
+                    if line.startswith(":"):
+                        # heartbeat comment
+                        continue
+                    if line.startswith("event:"):
+                        event_type = line.split(":", 1)[1].strip()
+                        continue
+                    if line.startswith("data:"):
+                        data_lines.append(line.split(":", 1)[1].strip())
+                        continue
+                # loop ended; mark disconnected
+                self.streamStatusChanged.emit(False)
+            except Exception:
+                # Stream trouble is reported through the status only;
+                # errorOccurred is kept for failed KPI/history requests
+                self.streamStatusChanged.emit(False)
+            # If still running, wait and reconnect
+            if not self._isStreaming():
+                break
+            time.sleep(5)
 
 
 class AuditLogsProvider(QtCore.QObject):
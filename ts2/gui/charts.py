@@ -19,8 +19,10 @@
 #
 
 from Qt import QtCore, QtWidgets, Qt, QtGui
+import bisect
 import random
 import math
+from array import array
 from datetime import datetime, timedelta
 
 
@@ -30,17 +32,38 @@ class SimpleChart(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.data = []
+        self._point_buffers = {}  # key: QPolygonF reused across paints
         self.setMinimumSize(200, 100)
         
     def setData(self, data):
         """Set chart data"""
         self.data = data
         self.update()
+
+    def pointBuffer(self, key, count):
+        """Return the persistent QPolygonF stored under key, sized to count"""
+        points = self._point_buffers.get(key)
+        if points is None:
+            points = self._point_buffers[key] = QtGui.QPolygonF()
+        if points.size() != count:
+            points.fill(QtCore.QPointF(), count)
+        return points
+
+    @staticmethod
+    def fillPoints(points, values, left, x_step, bottom, y_scale, min_val):
+        """Write chart coordinates for values straight into the polygon's
+        point storage, without creating a QPointF per value"""
+        count = len(values)
+        ptr = points.data()
+        ptr.setsize(count * 16)  # QPointF is two doubles
+        coords = memoryview(ptr).cast('B').cast('d')
+        coords[0::2] = array('d', [left + i * x_step for i in range(count)])
+        coords[1::2] = array('d', [bottom - (val - min_val) * y_scale for val in values])
         
     def paintEvent(self, event):
         """Override to draw chart"""
+        # Axis-aligned background, no antialiasing needed
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
         rect = self.rect()
         
         # Draw background
@@ -51,15 +74,45 @@ class SimpleChart(QtWidgets.QWidget):
 
 class SparklineChart(SimpleChart):
     """Modern sparkline chart for trend visualization"""
+
+    # Shared area fill texture, built on first use; compact sparklines such
+    # as KPITile's draw no area and never build it
+    _gradient_strip = None
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.color = QtGui.QColor(59, 130, 246)  # Modern blue
+        self.compact = False
         self.setFixedHeight(30)
+        # The background is always filled, so Qt can skip erasing it
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    @classmethod
+    def gradientStrip(cls):
+        """Return the blue fade of the area fill pre-rendered into a 1px wide
+        pixmap, which is stretched over the area instead of interpolating a
+        gradient on every paint"""
+        if cls._gradient_strip is None:
+            strip = QtGui.QPixmap(1, 128)
+            strip.fill(Qt.transparent)
+            gradient = QtGui.QLinearGradient(0, 0, 0, 128)
+            gradient.setColorAt(0, QtGui.QColor(59, 130, 246, 60))  # Semi-transparent blue
+            gradient.setColorAt(1, QtGui.QColor(59, 130, 246, 10))  # Very light blue
+            p = QtGui.QPainter(strip)
+            p.fillRect(0, 0, 1, 128, QtGui.QBrush(gradient))
+            p.end()
+            cls._gradient_strip = strip
+        return cls._gradient_strip
+
+    def setCompact(self, compact):
+        """In compact mode only a 1px integer polyline is drawn, without
+        antialiasing or area fill, which is all a tiny sparkline can show"""
+        self.compact = compact
+        self.update()
         
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, not self.compact)
         
         # Clear background
         painter.fillRect(self.rect(), QtGui.QColor(248, 250, 252))
@@ -74,36 +127,38 @@ class SparklineChart(SimpleChart):
         min_val = min(self.data)
         max_val = max(self.data)
         val_range = max_val - min_val if max_val != min_val else 1
-        
-        # Create gradient for area fill
-        gradient = QtGui.QLinearGradient(0, rect.top(), 0, rect.bottom())
-        gradient.setColorAt(0, QtGui.QColor(59, 130, 246, 60))  # Semi-transparent blue
-        gradient.setColorAt(1, QtGui.QColor(59, 130, 246, 10))  # Very light blue
+
+        if self.compact:
+            left, bottom = rect.left(), rect.bottom()
+            x_step = rect.width() / (len(self.data) - 1)
+            y_scale = rect.height() / val_range
+            line = QtGui.QPolygon([QtCore.QPoint(left + int(i * x_step),
+                                                 bottom - int((val - min_val) * y_scale))
+                                   for i, val in enumerate(self.data)])
+            painter.setPen(QtGui.QPen(self.color, 1))
+            painter.drawPolyline(line)
+            return
         
         # Draw area under curve
+        n = len(self.data)
+        points = self.pointBuffer("trend", n)
+        self.fillPoints(points, self.data, rect.left(), rect.width() / (n - 1),
+                        rect.bottom(), rect.height() / val_range, min_val)
+
         area_path = QtGui.QPainterPath()
-        points = []
-        for i, val in enumerate(self.data):
-            x = rect.left() + (i / (len(self.data) - 1)) * rect.width()
-            y = rect.bottom() - ((val - min_val) / val_range) * rect.height()
-            points.append(QtCore.QPointF(x, y))
-            
-        if points:
-            area_path.moveTo(rect.left(), rect.bottom())
-            for point in points:
-                area_path.lineTo(point)
-            area_path.lineTo(rect.right(), rect.bottom())
-            area_path.closeSubpath()
-            
-            painter.fillPath(area_path, gradient)
-            
-            # Draw line
-            painter.setPen(QtGui.QPen(self.color, 2))
-            line_path = QtGui.QPainterPath()
-            line_path.moveTo(points[0])
-            for point in points[1:]:
-                line_path.lineTo(point)
-            painter.drawPath(line_path)
+        area_path.addPolygon(points)
+        area_path.lineTo(rect.right(), rect.bottom())
+        area_path.lineTo(rect.left(), rect.bottom())
+        area_path.closeSubpath()
+        
+        painter.save()
+        painter.setClipPath(area_path)
+        painter.drawPixmap(rect, self.gradientStrip())
+        painter.restore()
+        
+        # Draw line
+        painter.setPen(QtGui.QPen(self.color, 2))
+        painter.drawPolyline(points)
 
 
 class BarChart(SimpleChart):
@@ -113,11 +168,35 @@ class BarChart(SimpleChart):
         super().__init__(parent)
         self.labels = []
         self.colors = [QtGui.QColor(73, 80, 87), QtGui.QColor(108, 117, 125), QtGui.QColor(134, 142, 150)]
+        self._bars_pixmap = None  # Bars rendered once per data/size change
         
     def setData(self, data, labels=None):
         """Set data with optional labels"""
+        self._bars_pixmap = None
         super().setData(data)
         self.labels = labels or [str(i) for i in range(len(data))]
+
+    def resizeEvent(self, event):
+        self._bars_pixmap = None
+        super().resizeEvent(event)
+
+    def _renderBars(self, size):
+        """Render all bars into a transparent pixmap of the plot area size"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        width, height = size.width(), size.height()
+        max_val = max(self.data) or 1
+        bar_width = width / len(self.data) * 0.8
+        spacing = width / len(self.data) * 0.2
+        for i, val in enumerate(self.data):
+            color = self.colors[i % len(self.colors)]
+            h = int((val / max_val) * height)
+            painter.fillRect(int(i * (bar_width + spacing)), height - h, int(bar_width), h, color)
+        painter.end()
+        return pixmap
         
     def paintEvent(self, event):
         super().paintEvent(event)
@@ -125,25 +204,18 @@ class BarChart(SimpleChart):
         if not self.data:
             return
             
+        # Bars and axis are axis-aligned integer rectangles, so antialiasing
+        # would only cost raster time
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
         
         # Calculate bounds
         margin = 20
         rect = self.rect().adjusted(margin, margin, -margin, -margin)
         
-        max_val = max(self.data) if self.data else 1
-        bar_width = rect.width() / len(self.data) * 0.8
-        spacing = rect.width() / len(self.data) * 0.2
-        
-        # Draw bars
-        for i, val in enumerate(self.data):
-            color = self.colors[i % len(self.colors)]
-            x = int(rect.left() + i * (bar_width + spacing))
-            y = int(rect.bottom() - (val / max_val) * rect.height())
-            w = int(bar_width)
-            h = int((val / max_val) * rect.height())
-            painter.fillRect(x, y, w, h, color)
+        # Draw bars, blitting the cached strip unless data or size changed
+        if self._bars_pixmap is None:
+            self._bars_pixmap = self._renderBars(rect.size())
+        painter.drawPixmap(rect.topLeft(), self._bars_pixmap)
             
         # Draw axis
         painter.setPen(QtGui.QPen(QtGui.QColor(100, 100, 100), 1))
@@ -156,9 +228,19 @@ class LineChart(SimpleChart):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.series = {}  # name: (data, color)
+        self._markers = {}  # name: pre-rendered data point marker
+        self._target = None  # (value, color, label) of a constant target line
+        self._bg_cache = None  # background gradient and grid, per widget size
         self.show_grid = True
         self.x_label = ""
         self.y_label = ""
+        # Y-axis labels keep their glyph layout cached between paints
+        self._grid_labels = []
+        for _ in range(6):
+            label = QtGui.QStaticText()
+            label.setTextWidth(50)  # Left margin minus padding
+            label.setTextOption(QtGui.QTextOption(Qt.AlignRight))
+            self._grid_labels.append(label)
         
     def addSeries(self, name, data, color=None):
         """Add a data series with modern colors"""
@@ -173,12 +255,83 @@ class LineChart(SimpleChart):
             ]
             color = colors[len(self.series) % len(colors)]
         self.series[name] = (data, color)
+        self._markers[name] = self._createMarker(color)
         self.update()
         
+    def setStaticTarget(self, value, color=None, label=None):
+        """Draw a horizontal target line at value, without storing it as a
+        series; pass None to remove it"""
+        if value is None:
+            self._target = None
+        else:
+            if color is None:
+                color = QtGui.QColor(134, 142, 150)
+            self._target = (value, color, label or f"Target ({value})")
+        self.update()
+
+    def resizeEvent(self, event):
+        self._bg_cache = None
+        super().resizeEvent(event)
+
+    def _background(self, rect):
+        """Return the gradient and grid lines rendered once per size"""
+        if self._bg_cache is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QtGui.QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            p = QtGui.QPainter(pixmap)
+            p.setRenderHint(QtGui.QPainter.Antialiasing)
+            gradient = QtGui.QLinearGradient(0, 0, 0, self.rect().height())
+            gradient.setColorAt(0, QtGui.QColor(255, 255, 255))
+            gradient.setColorAt(1, QtGui.QColor(248, 250, 252))
+            p.fillRect(self.rect(), gradient)
+            if self.show_grid:
+                p.setPen(QtGui.QPen(QtGui.QColor(229, 231, 235), 1))
+                p.drawLines([QtCore.QLineF(rect.left(), y, rect.right(), y)
+                             for y in self._gridYs(rect)])
+            p.end()
+            self._bg_cache = pixmap
+        return self._bg_cache
+
+    @staticmethod
+    def _gridYs(rect):
+        return [int(rect.top() + (i / 5) * rect.height()) for i in range(6)]
+
+    def updateTail(self, name, tail):
+        """Replace the last len(tail) samples of an existing series in place"""
+        data, _color = self.series[name]
+        data[len(data) - len(tail):] = tail
+        self.update()
+
+    def appendPoints(self, name, points, drop=0):
+        """Append samples to an existing series in place, first dropping its
+        drop oldest samples (for a sliding window)"""
+        data, _color = self.series[name]
+        if drop:
+            del data[:drop]
+        data.extend(points)
+        self.update()
+
     def clearSeries(self):
         """Clear all series"""
         self.series.clear()
+        self._markers.clear()
         self.update()
+
+    def _createMarker(self, color):
+        """Render a data point marker once so it can be blitted per point"""
+        # 8px dot plus its 2px white outline, at the screen's pixel ratio
+        ratio = self.devicePixelRatioF()
+        marker = QtGui.QPixmap(QtCore.QSize(10, 10) * ratio)
+        marker.setDevicePixelRatio(ratio)
+        marker.fill(Qt.transparent)
+        p = QtGui.QPainter(marker)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        p.setBrush(QtGui.QBrush(color))
+        p.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255), 2))
+        p.drawEllipse(QtCore.QRectF(1, 1, 8, 8))
+        p.end()
+        return marker
     
     def setAxisLabels(self, x_label=None, y_label=None):
         """Set axis labels for chart (optional)"""
@@ -189,18 +342,16 @@ class LineChart(SimpleChart):
         self.update()
         
     def paintEvent(self, event):
-        super().paintEvent(event)
-        
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         
-        # Clear background with subtle gradient
-        gradient = QtGui.QLinearGradient(0, 0, 0, self.rect().height())
-        gradient.setColorAt(0, QtGui.QColor(255, 255, 255))
-        gradient.setColorAt(1, QtGui.QColor(248, 250, 252))
-        painter.fillRect(self.rect(), gradient)
-        
         if not self.series:
+            # Clear background with subtle gradient
+            gradient = QtGui.QLinearGradient(0, 0, 0, self.rect().height())
+            gradient.setColorAt(0, QtGui.QColor(255, 255, 255))
+            gradient.setColorAt(1, QtGui.QColor(248, 250, 252))
+            painter.fillRect(self.rect(), gradient)
+
             # Draw empty state
             painter.setPen(QtGui.QPen(QtGui.QColor(156, 163, 175), 1))
             font = painter.font()
@@ -215,11 +366,16 @@ class LineChart(SimpleChart):
         right_margin = 20  # Space at right
         bottom_margin = 40 # Space for X-axis labels
         rect = self.rect().adjusted(left_margin, top_margin, -right_margin, -bottom_margin)
+
+        # Background gradient and grid lines come pre-rendered
+        painter.drawPixmap(0, 0, self._background(rect))
         
         # Find data bounds
         all_data = []
         for data, _ in self.series.values():
             all_data.extend(data)
+        if self._target is not None:
+            all_data.append(self._target[0])
             
         if not all_data:
             return
@@ -234,70 +390,71 @@ class LineChart(SimpleChart):
         max_val += padding
         val_range = max_val - min_val
         
-        # Draw grid with better styling
+        # Draw Y-axis labels next to the cached grid lines
         if self.show_grid:
-            painter.setPen(QtGui.QPen(QtGui.QColor(229, 231, 235), 1))
-            for i in range(6):  # More grid lines
-                y = int(rect.top() + (i / 5) * rect.height())
-                painter.drawLine(rect.left(), y, rect.right(), y)
-                
-                # Draw Y-axis labels
-                value = max_val - (i / 5) * val_range
-                painter.setPen(QtGui.QPen(QtGui.QColor(107, 114, 128), 1))
-                font = painter.font()
-                font.setPointSize(10)
-                painter.setFont(font)
-                painter.drawText(QtCore.QRectF(5, y - 8, left_margin - 10, 16), 
-                                Qt.AlignRight | Qt.AlignVCenter, f"{value:.1f}")
-                painter.setPen(QtGui.QPen(QtGui.QColor(229, 231, 235), 1))
+            grid_ys = self._gridYs(rect)
+            painter.setPen(QtGui.QPen(QtGui.QColor(107, 114, 128), 1))
+            font = painter.font()
+            font.setPointSize(10)
+            painter.setFont(font)
+            for i, (y, label) in enumerate(zip(grid_ys, self._grid_labels)):
+                text = f"{max_val - (i / 5) * val_range:.1f}"
+                if label.text() != text:
+                    label.setText(text)
+                painter.drawStaticText(QtCore.QPointF(5, y - label.size().height() / 2), label)
                 
-        # Draw series with area fill and enhanced styling
+        # Draw series with area fill and enhanced styling, unless only the
+        # margins (labels, legend) need repainting
+        plot_dirty = event.rect().intersects(rect.adjusted(-5, -5, 5, 5))
         for idx, (name, (data, color)) in enumerate(self.series.items()):
-            if len(data) < 2:
+            if not plot_dirty or len(data) < 2:
                 continue
             
-            points = []
-            for i, val in enumerate(data):
-                x = rect.left() + (i / (len(data) - 1)) * rect.width()
-                y = rect.bottom() - ((val - min_val) / val_range) * rect.height()
-                points.append(QtCore.QPointF(x, y))
+            n = len(data)
+            points = self.pointBuffer(name, n)
+            self.fillPoints(points, data, rect.left(), rect.width() / (n - 1),
+                            rect.bottom(), rect.height() / val_range, min_val)
+
+            # Create area fill with gradient
+            area_path = QtGui.QPainterPath()
+            area_path.addPolygon(points)
+            area_path.lineTo(rect.right(), rect.bottom())
+            area_path.lineTo(rect.left(), rect.bottom())
+            area_path.closeSubpath()
             
-            if len(points) > 1:
-                # Create area fill with gradient
-                area_path = QtGui.QPainterPath()
-                area_path.moveTo(rect.left(), rect.bottom())
-                for point in points:
-                    area_path.lineTo(point)
-                area_path.lineTo(rect.right(), rect.bottom())
-                area_path.closeSubpath()
-                
-                # Area gradient
-                area_gradient = QtGui.QLinearGradient(0, rect.top(), 0, rect.bottom())
-                area_color = QtGui.QColor(color)
-                area_color.setAlpha(30)
-                area_gradient.setColorAt(0, area_color)
-                area_color.setAlpha(5)
-                area_gradient.setColorAt(1, area_color)
-                painter.fillPath(area_path, area_gradient)
-                
-                # Draw main line with thicker stroke
-                painter.setPen(QtGui.QPen(color, 3))
-                line_path = QtGui.QPainterPath()
-                line_path.moveTo(points[0])
-                for point in points[1:]:
-                    line_path.lineTo(point)
-                painter.drawPath(line_path)
-                
-                # Draw data points
-                painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255), 2))
-                painter.setBrush(QtGui.QBrush(color))
-                for point in points[::max(1, len(points)//10)]:  # Show every 10th point
-                    painter.drawEllipse(point, 4, 4)
+            # Area gradient
+            area_gradient = QtGui.QLinearGradient(0, rect.top(), 0, rect.bottom())
+            area_color = QtGui.QColor(color)
+            area_color.setAlpha(30)
+            area_gradient.setColorAt(0, area_color)
+            area_color.setAlpha(5)
+            area_gradient.setColorAt(1, area_color)
+            painter.fillPath(area_path, area_gradient)
+            
+            # Draw main line with thicker stroke
+            painter.setPen(QtGui.QPen(color, 3))
+            painter.drawPolyline(points)
+            
+            # Draw data points (every 10th) in a single pixmap blit
+            marker = self._markers[name]
+            source = QtCore.QRectF(marker.rect())
+            # Fragment sources are in device pixels; scale back to logical size
+            scale = 1 / marker.devicePixelRatioF()
+            fragments = [QtGui.QPainter.PixmapFragment.create(points.at(i), source, scale, scale)
+                         for i in range(0, n, max(1, n // 10))]
+            painter.drawPixmapFragments(fragments, marker)
+
+        # Constant target line: two points, whatever the series length
+        if plot_dirty and self._target is not None:
+            target, target_color, _label = self._target
+            y = rect.bottom() - (target - min_val) * (rect.height() / val_range)
+            painter.setPen(QtGui.QPen(target_color, 3))
+            painter.drawLine(QtCore.QLineF(rect.left(), y, rect.right(), y))
                 
         # Draw enhanced axes
         painter.setPen(QtGui.QPen(QtGui.QColor(107, 114, 128), 2))
-        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
-        painter.drawLine(rect.bottomLeft(), rect.topLeft())
+        painter.drawLines([QtCore.QLine(rect.bottomLeft(), rect.bottomRight()),
+                           QtCore.QLine(rect.bottomLeft(), rect.topLeft())])
         
         # Enhanced axis labels
         if self.x_label:
@@ -323,7 +480,10 @@ class LineChart(SimpleChart):
             painter.restore()
             
         # Draw legend if multiple series (positioned safely within bounds)
-        if len(self.series) > 1:
+        legend = [(name, color) for name, (_data, color) in self.series.items()]
+        if self._target is not None:
+            legend.append((self._target[2], self._target[1]))
+        if len(legend) > 1:
             legend_y = rect.top() + 10
             legend_x = rect.right() - 140
             
@@ -332,7 +492,7 @@ class LineChart(SimpleChart):
             font.setPointSize(9)
             painter.setFont(font)
             
-            for idx, (name, (data, color)) in enumerate(self.series.items()):
+            for idx, (name, color) in enumerate(legend):
                 y_pos = legend_y + idx * 18
                 
                 # Legend color box
@@ -368,6 +528,7 @@ class HeatmapChart(SimpleChart):
             return
             
         painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)  # Cells are axis-aligned
         
         rows = len(self.matrix_data)
         cols = len(self.matrix_data[0]) if rows > 0 else 0
@@ -381,6 +542,8 @@ class HeatmapChart(SimpleChart):
         
         cell_width = rect.width() / cols
         cell_height = rect.height() / rows
+        if cell_width <= 0 or cell_height <= 0:
+            return
         
         # Find data bounds for color mapping
         all_values = [val for row in self.matrix_data for val in row]
@@ -388,9 +551,16 @@ class HeatmapChart(SimpleChart):
         max_val = max(all_values) if all_values else 1
         val_range = max_val - min_val if max_val != min_val else 1
         
-        # Draw cells
-        for i, row in enumerate(self.matrix_data):
-            for j, val in enumerate(row):
+        # Draw cells, skipping rows and columns outside the repainted rect
+        dirty = event.rect()
+        first_row = max(0, int((dirty.top() - rect.top()) / cell_height))
+        last_row = min(rows, int((dirty.bottom() - rect.top()) / cell_height) + 1)
+        first_col = max(0, int((dirty.left() - rect.left()) / cell_width))
+        last_col = min(cols, int((dirty.right() - rect.left()) / cell_width) + 1)
+        for i in range(first_row, last_row):
+            row = self.matrix_data[i]
+            for j in range(first_col, last_col):
+                val = row[j]
                 # Color intensity based on value
                 intensity = (val - min_val) / val_range
                 color = QtGui.QColor(255, int(255 - 155 * intensity), int(255 - 155 * intensity))
@@ -402,37 +572,77 @@ class HeatmapChart(SimpleChart):
                     int(cell_height),
                     color
                 )
-                
-                # Draw cell border
-                painter.setPen(QtGui.QPen(QtGui.QColor(200, 200, 200), 1))
-                painter.drawRect(
-                    int(rect.left() + j * cell_width),
-                    int(rect.top() + i * cell_height),
-                    int(cell_width),
-                    int(cell_height)
-                )
+
+        # Draw cell borders in one call: a line per row and column boundary
+        xs = [int(rect.left() + j * cell_width) for j in range(cols + 1)]
+        ys = [int(rect.top() + i * cell_height) for i in range(rows + 1)]
+        borders = [QtCore.QLineF(xs[0], y, xs[-1], y) for y in ys]
+        borders.extend(QtCore.QLineF(x, ys[0], x, ys[-1]) for x in xs)
+        painter.setPen(QtGui.QPen(QtGui.QColor(200, 200, 200), 1))
+        painter.drawLines(borders)
 
 
 class GaugeChart(SimpleChart):
     """Simple gauge/dial chart"""
+
+    # Value ratios at which the arc switches to the next gray (minimal scale)
+    COLOR_STOPS = (0.5, 0.8)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.value = 0
         self.min_value = 0
         self.max_value = 100
+        self._bg_pen = QtGui.QPen(QtGui.QColor(200, 200, 200), 8)
+        self._value_pens = (
+            QtGui.QPen(QtGui.QColor(73, 80, 87), 8),     # Dark gray
+            QtGui.QPen(QtGui.QColor(108, 117, 125), 8),  # Medium gray
+            QtGui.QPen(QtGui.QColor(134, 142, 150), 8),  # Light gray
+        )
+        self._bg_arc = QtGui.QPainterPath()
+        self._value_arc = None
+        self._value_pen = self._value_pens[0]
         self.setFixedSize(100, 100)
         
     def setValue(self, value):
         """Set gauge value"""
         self.value = max(self.min_value, min(self.max_value, value))
+        self._rebuildValueArc()
         self.update()
         
     def setRange(self, min_val, max_val):
         """Set gauge range"""
         self.min_value = min_val
         self.max_value = max_val
+        self._rebuildValueArc()
         self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        arc_rect = self._arcRect()
+        self._bg_arc = QtGui.QPainterPath()
+        self._bg_arc.arcMoveTo(arc_rect, 45)
+        self._bg_arc.arcTo(arc_rect, 45, 270)
+        self._rebuildValueArc()
+
+    def _arcRect(self):
+        rect = self.rect()
+        center = rect.center()
+        radius = min(rect.width(), rect.height()) // 2 - 10
+        return QtCore.QRectF(center.x() - radius, center.y() - radius,
+                             radius * 2, radius * 2)
+
+    def _rebuildValueArc(self):
+        """Rebuild the value arc path; only needed when value, range or size change"""
+        if self.max_value <= self.min_value:
+            self._value_arc = None
+            return
+        ratio = (self.value - self.min_value) / (self.max_value - self.min_value)
+        self._value_pen = self._value_pens[bisect.bisect_right(self.COLOR_STOPS, ratio)]
+        arc_rect = self._arcRect()
+        self._value_arc = QtGui.QPainterPath()
+        self._value_arc.arcMoveTo(arc_rect, 45)
+        self._value_arc.arcTo(arc_rect, 45, int(270 * ratio))
         
     def paintEvent(self, event):
         super().paintEvent(event)
@@ -440,33 +650,10 @@ class GaugeChart(SimpleChart):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         
-        rect = self.rect()
-        center = rect.center()
-        radius = min(rect.width(), rect.height()) // 2 - 10
-        
-        # Draw gauge background
-        painter.setPen(QtGui.QPen(QtGui.QColor(200, 200, 200), 8))
-        painter.drawArc(int(center.x() - radius), int(center.y() - radius), 
-                       int(radius * 2), int(radius * 2), 
-                       45 * 16, 270 * 16)
-        
-        # Draw gauge value
-        if self.max_value > self.min_value:
-            ratio = (self.value - self.min_value) / (self.max_value - self.min_value)
-            angle = int(270 * ratio)
-            
-            # Color based on value - minimal gray scale
-            if ratio < 0.5:
-                color = QtGui.QColor(73, 80, 87)  # Dark gray
-            elif ratio < 0.8:
-                color = QtGui.QColor(108, 117, 125)  # Medium gray
-            else:
-                color = QtGui.QColor(134, 142, 150)  # Light gray
-                
-            painter.setPen(QtGui.QPen(color, 8))
-            painter.drawArc(int(center.x() - radius), int(center.y() - radius), 
-                           int(radius * 2), int(radius * 2), 
-                           45 * 16, angle * 16)
+        # Draw gauge background and value
+        painter.strokePath(self._bg_arc, self._bg_pen)
+        if self._value_arc is not None:
+            painter.strokePath(self._value_arc, self._value_pen)
         
         # Draw value text
         painter.setPen(QtGui.QPen(QtGui.QColor(50, 50, 50), 1))
@@ -474,7 +661,36 @@ class GaugeChart(SimpleChart):
         font.setPointSize(12)
         font.setBold(True)
         painter.setFont(font)
-        painter.drawText(rect, Qt.AlignCenter, str(int(self.value)))
+        painter.drawText(self.rect(), Qt.AlignCenter, str(int(self.value)))
+
+
+# KPITile style sheets: the delta badge has one style per sign, and value
+# label styles are formatted once per colour as they are first used
+_KPI_DELTA_STYLES = {
+    positive: f"""
+        font-size: 12px;
+        font-weight: 600;
+        padding: 2px 6px;
+        border-radius: 4px;
+        background-color: {bg_color};
+        color: {text_color};
+    """
+    for positive, bg_color, text_color in ((True, "#dcfce7", "#166534"),   # green
+                                            (False, "#fef2f2", "#dc2626"))  # red
+}
+_KPI_VALUE_STYLES = {}
+
+
+def _kpiValueStyle(color):
+    style = _KPI_VALUE_STYLES.get(color)
+    if style is None:
+        style = _KPI_VALUE_STYLES[color] = f"""
+            font-size: 28px; 
+            font-weight: 700; 
+            color: {color};
+            line-height: 1;
+        """
+    return style
 
 
 class KPITile(QtWidgets.QWidget):
@@ -487,6 +703,8 @@ class KPITile(QtWidgets.QWidget):
         self.unit = unit
         self.trend_data = []
         self.delta = None
+        self._delta_positive = None
+        self._value_color = None
         self.setupUI()
         
     def setupUI(self):
@@ -525,12 +743,7 @@ class KPITile(QtWidgets.QWidget):
         value_container.setSpacing(6)
         
         self.value_label = QtWidgets.QLabel(str(self.value))
-        self.value_label.setStyleSheet("""
-            font-size: 28px; 
-            font-weight: 700; 
-            color: #1e293b;
-            line-height: 1;
-        """)
+        self.value_label.setStyleSheet(_kpiValueStyle("#1e293b"))
         value_container.addWidget(self.value_label)
         
         self.unit_label = QtWidgets.QLabel(self.unit)
@@ -564,59 +777,68 @@ class KPITile(QtWidgets.QWidget):
         
         self.sparkline = SparklineChart()
         self.sparkline.setFixedSize(70, 24)
-        # bottom_container.addWidget(self.sparkline)
+        self.sparkline.setCompact(True)
+        bottom_container.addWidget(self.sparkline)
         
         layout.addLayout(bottom_container)
         
     def updateValue(self, value, delta=None, trend_data=None):
         """Update tile value and trend"""
-        self.value = value
-        self.value_label.setText(str(value))
+        if value != self.value:
+            self.value = value
+            self.value_label.setText(str(value))
         
-        # Update delta with modern styling
+        # Update delta with modern styling; the style sheet only depends on
+        # the sign, so it is re-applied only when the sign flips
         if delta is not None:
             self.delta = delta
-            if delta > 0:
+            positive = delta > 0
+            if positive:
                 delta_text = f"↗ +{abs(delta):.1f}"
-                bg_color = "#dcfce7"  # Light green
-                text_color = "#166534"  # Dark green
             else:
                 delta_text = f"↘ -{abs(delta):.1f}"
-                bg_color = "#fef2f2"  # Light red
-                text_color = "#dc2626"  # Dark red
-                
-            self.delta_label.setText(delta_text)
-            self.delta_label.setStyleSheet(f"""
-                font-size: 12px;
-                font-weight: 600;
-                padding: 2px 6px;
-                border-radius: 4px;
-                background-color: {bg_color};
-                color: {text_color};
-            """)
+            if delta_text != self.delta_label.text():
+                self.delta_label.setText(delta_text)
+            if positive != self._delta_positive:
+                self._delta_positive = positive
+                self.delta_label.setStyleSheet(_KPI_DELTA_STYLES[positive])
         
         # Update sparkline
         if trend_data:
-            self.trend_data = trend_data
-            self.sparkline.setData(trend_data)
+            self.setTrend(trend_data)
+
+    def setTrend(self, trend_data):
+        """Show a history series in the sparkline"""
+        self.trend_data = trend_data
+        self.sparkline.setData(trend_data)
             
     def setValueColor(self, color):
         """Set value label color based on threshold"""
-        self.value_label.setStyleSheet(f"""
-            font-size: 28px; 
-            font-weight: 700; 
-            color: {color};
-            line-height: 1;
-        """)
+        if color == self._value_color:
+            return
+        self._value_color = color
+        self.value_label.setStyleSheet(_kpiValueStyle(color))
+
+
+def _uniformSamples(low, high, count):
+    """Draw count floats in [low, high) using the C-level random.random"""
+    span = high - low
+    rnd = random.random
+    return [low + span * rnd() for _ in range(count)]
+
+
+def _integerSamples(low, high, count):
+    """Draw count integers in [low, high] with a single random.choices call"""
+    return random.choices(range(low, high + 1), k=count)
 
 
 def generateMockData():
     """Generate mock data for testing charts"""
     return {
-        'rtp_hourly': [random.uniform(75, 95) for _ in range(24)],
-        'delay_trend': [random.uniform(2, 12) for _ in range(60)],
-        'throughput_data': [(random.randint(15, 25), random.randint(12, 20)) for _ in range(24)],
+        'rtp_hourly': _uniformSamples(75, 95, 24),
+        'delay_trend': _uniformSamples(2, 12, 60),
+        'throughput_data': list(zip(_integerSamples(15, 25, 24), _integerSamples(12, 20, 24))),
         'conflict_funnel': [45, 38, 32, 30],
-        'platform_heatmap': [[random.randint(0, 100) for _ in range(24)] for _ in range(8)],
-        'headway_data': [random.uniform(2.5, 4.0) for _ in range(100)]
+        'platform_heatmap': [_integerSamples(0, 100, 24) for _ in range(8)],
+        'headway_data': _uniformSamples(2.5, 4.0, 100)
     }
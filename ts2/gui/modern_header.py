@@ -22,6 +22,136 @@ from Qt import QtCore, QtWidgets, Qt, QtGui
 from ts2.gui import widgets
 
 
+# Size policy shared by the fixed-height widgets of the header
+_SP_PREFERRED_FIXED = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred,
+                                            QtWidgets.QSizePolicy.Fixed)
+
+# Single style sheet for the whole header, parsed once and matched by
+# object name; the pause button switches look through its "state" property
+_STYLESHEET = """
+    ModernHeaderWidget {
+        background-color: #f8f9fa;
+        border-bottom: 1px solid #dee2e6;
+    }
+    QLabel#sectionLabel {
+        color: #6c757d;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QLabel#zoomLabel {
+        color: #6c757d;
+        font-weight: bold;
+        font-size: 10px;
+    }
+    QPushButton#openBtn, QPushButton#editBtn, QPushButton#restartBtn {
+        background-color: white;
+        border: 1px solid #ced4da;
+        border-radius: 3px;
+        padding: 8px 12px;
+        color: #495057;
+        font-weight: 500;
+        font-size: 12px;
+    }
+    QPushButton#openBtn:hover, QPushButton#editBtn:hover, QPushButton#restartBtn:hover {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+    QPushButton#openBtn:pressed, QPushButton#editBtn:pressed, QPushButton#restartBtn:pressed {
+        background-color: #dee2e6;
+    }
+    QSpinBox#speedSpin {
+        background-color: white;
+        border: 1px solid #ced4da;
+        border-radius: 3px;
+        padding: 0px 4px;
+        color: #495057;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    #zoomWidget QSlider::groove:horizontal {
+        border: 1px solid #ced4da;
+        height: 5px;
+        background: white;
+        border-radius: 2px;
+    }
+    #zoomWidget QSlider::handle:horizontal {
+        background: #495057;
+        border: 1px solid #343a40;
+        width: 12px;
+        height: 12px;
+        border-radius: 6px;
+        margin: -4px 0;
+    }
+    #zoomWidget QSlider::handle:horizontal:hover {
+        background: #343a40;
+    }
+    #zoomWidget QSpinBox {
+        background-color: white;
+        border: 1px solid #ced4da;
+        border-radius: 3px;
+        padding: 2px 4px;
+        font-size: 10px;
+        max-width: 45px;
+    }
+    #zoomWidget QSpinBox::up-button, #zoomWidget QSpinBox::down-button {
+        width: 0px;
+    }
+    #zoomWidget QToolButton {
+        background-color: white;
+        border: 1px solid #ced4da;
+        border-radius: 3px;
+        padding: 2px 4px;
+        font-size: 10px;
+    }
+    QLabel#scoreDisplay {
+        background-color: white;
+        border: 1px solid #ced4da;
+        border-radius: 3px;
+        color: #495057;
+        font-family: monospace;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton#pauseBtn {
+        border-radius: 3px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#pauseBtn[state="paused"] {
+        background-color: #28a745;
+        border: 1px solid #28a745;
+        color: white;
+    }
+    QPushButton#pauseBtn[state="paused"]:hover {
+        background-color: #218838;
+    }
+    QPushButton#pauseBtn[state="running"] {
+        background-color: #ffc107;
+        border: 1px solid #ffc107;
+        color: #212529;
+    }
+    QPushButton#pauseBtn[state="running"]:hover {
+        background-color: #e0a800;
+    }
+    QLCDNumber#clockWidget {
+        background-color: #343a40;
+        border: 1px solid #495057;
+        border-radius: 3px;
+        color: white;
+        font-size: 12px;
+    }
+    QLabel#titleLabel {
+        background-color: white;
+        border: 1px solid #ced4da;
+        border-radius: 3px;
+        padding: 6px 10px;
+        color: #495057;
+        font-size: 12px;
+        font-weight: 500;
+    }
+"""
+
+
 class ModernHeaderWidget(QtWidgets.QWidget):
     """Modern header widget with perfect layout and minimal design"""
     
@@ -37,25 +167,43 @@ class ModernHeaderWidget(QtWidgets.QWidget):
         super().__init__(parent)
         self.current_speed = 1
         self.is_paused = True
+        self._score = 0
+        self._last_title = None
+        # Clock/score updates that arrive while hidden are applied on show
+        self._pending_time = None
+        self._controls_enabled = True
+        self._edit_enabled = True
+        # Bursts of speed/zoom changes (auto-repeat, wheel) are coalesced so
+        # listeners get only the latest value once per event loop iteration
+        self._zoom_value = 100
+        self._speed_emit_timer = QtCore.QTimer(self)
+        self._speed_emit_timer.setSingleShot(True)
+        self._speed_emit_timer.setInterval(0)
+        self._speed_emit_timer.timeout.connect(self._emitSpeedChanged)
+        self._zoom_emit_timer = QtCore.QTimer(self)
+        self._zoom_emit_timer.setSingleShot(True)
+        self._zoom_emit_timer.setInterval(0)
+        self._zoom_emit_timer.timeout.connect(self._emitZoomChanged)
+        # Build everything before the first layout/repaint pass
+        self.setUpdatesEnabled(False)
         self.setupUI()
+        self.setUpdatesEnabled(True)
         
     def setupUI(self):
         """Setup the modern header UI with responsive layout"""
         self.setFixedHeight(50)
-        self.setStyleSheet("""
-            ModernHeaderWidget {
-                background-color: #f8f9fa;
-                border-bottom: 1px solid #dee2e6;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
         
         # Main horizontal layout with better space management
         main_layout = QtWidgets.QHBoxLayout(self)
         main_layout.setContentsMargins(10, 6, 10, 6)  # Reduced margins
         main_layout.setSpacing(12)  # Reduced spacing
         
-        # File Actions Section
-        self.setupFileSection(main_layout)
+        # File Actions Section (hidden by default, built on first reveal)
+        self.file_container = None
+        self.open_btn = None
+        self.edit_btn = None
+        self._file_slot = self._addSectionSlot(main_layout)
         
         # Speed Control Section  
         self.setupSpeedSection(main_layout)
@@ -63,21 +211,59 @@ class ModernHeaderWidget(QtWidgets.QWidget):
         # Zoom Control Section (make collapsible on small screens)
         self.setupZoomSection(main_layout)
         
-        # Performance Section
-        self.setupPerformanceSection(main_layout)
+        # Performance Section (hidden by default, built on first reveal)
+        self.perf_container = None
+        self.score_display = None
+        self._perf_slot = self._addSectionSlot(main_layout)
         
         # Time Control Section
         self.setupTimeSection(main_layout)
         
-        # Flexible spacer (but limited)
-        spacer = QtWidgets.QWidget()
-        spacer.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-        spacer.setMinimumWidth(20)  # Minimum spacer width
-        spacer.setMaximumWidth(100)  # Maximum spacer width
-        main_layout.addWidget(spacer)
+        # Flexible spacer, with the same 20px minimum the spacer widget had
+        main_layout.addSpacing(20)
+        main_layout.addStretch(1)
         
         # Simulation Title Section (most important, gets priority)
         self.setupTitleSection(main_layout)
+
+        # Widgets toggled by setControlsEnabled; the file buttons join
+        # when their section is built
+        self._controls = (self.speed_spin, self.pause_btn,
+                          self.restart_btn, self.zoom_widget)
+
+    def _addSectionSlot(self, main_layout):
+        """Reserve the position of a lazily built section with an empty
+        layout, which takes no space and no spacing until filled"""
+        slot = QtWidgets.QHBoxLayout()
+        slot.setContentsMargins(0, 0, 0, 0)
+        main_layout.addLayout(slot)
+        return slot
+
+    def showFileSection(self, visible):
+        """Show or hide the file actions section, building it when first shown"""
+        if self.file_container is None:
+            if not visible:
+                return
+            self.setupFileSection(self._file_slot)
+        self.file_container.setVisible(visible)
+
+    def showScoreSection(self, visible):
+        """Show or hide the score section, building it when first shown"""
+        if self.perf_container is None:
+            if not visible:
+                return
+            self.setupPerformanceSection(self._perf_slot)
+        self.perf_container.setVisible(visible)
+        if visible:
+            self._flushScore()
+
+    def showEvent(self, event):
+        """Apply the clock and score updates skipped while hidden"""
+        super().showEvent(event)
+        if self._pending_time is not None:
+            self.clock_widget.setTime(self._pending_time)
+            self._pending_time = None
+        self._flushScore()
         
     def setupFileSection(self, main_layout):
         """Setup file actions section"""
@@ -88,143 +274,76 @@ class ModernHeaderWidget(QtWidgets.QWidget):
         
         # Section label
         file_label = QtWidgets.QLabel("File")
-        file_label.setStyleSheet("color: #6c757d; font-weight: bold; font-size: 11px;")
+        file_label.setObjectName("sectionLabel")
         file_layout.addWidget(file_label)
         
         # Open button
         self.open_btn = QtWidgets.QPushButton("Open")
-        self.open_btn.clicked.connect(self.openActionTriggered.emit)
+        self.open_btn.setObjectName("openBtn")
+        self.open_btn.clicked.connect(self.openActionTriggered)
         self.open_btn.setFixedHeight(32)
-        self.open_btn.setStyleSheet(self.getButtonStyle())
+        self.open_btn.setEnabled(self._controls_enabled)
         file_layout.addWidget(self.open_btn)
         
         # Edit button
         self.edit_btn = QtWidgets.QPushButton("Edit")
-        self.edit_btn.clicked.connect(self.editActionTriggered.emit)
+        self.edit_btn.setObjectName("editBtn")
+        self.edit_btn.clicked.connect(self.editActionTriggered)
         self.edit_btn.setFixedHeight(32)
-        self.edit_btn.setStyleSheet(self.getButtonStyle())
+        self.edit_btn.setEnabled(self._edit_enabled)
         file_layout.addWidget(self.edit_btn)
+        self._controls += (self.open_btn, self.edit_btn)
         
         self.file_container.setFixedHeight(34)
         main_layout.addWidget(self.file_container)
-        # Hide the file section in the header by default
-        self.file_container.setVisible(False)
         
     def setupSpeedSection(self, main_layout):
         """Setup speed control section"""
-        speed_container = QtWidgets.QWidget()
-        speed_layout = QtWidgets.QHBoxLayout(speed_container)
+        speed_layout = QtWidgets.QHBoxLayout()
         speed_layout.setContentsMargins(0, 0, 0, 0)
         speed_layout.setSpacing(8)
         
         # Section label
         speed_label = QtWidgets.QLabel("Speed")
-        speed_label.setStyleSheet("color: #6c757d; font-weight: bold; font-size: 11px;")
+        speed_label.setObjectName("sectionLabel")
         speed_layout.addWidget(speed_label)
         
-        # Speed control group
-        speed_group = QtWidgets.QWidget()
-        speed_group_layout = QtWidgets.QHBoxLayout(speed_group)
-        speed_group_layout.setContentsMargins(0, 0, 0, 0)
-        speed_group_layout.setSpacing(1)
-        
-        # Decrease button
-        self.speed_down = QtWidgets.QPushButton("−")
-        self.speed_down.setFixedSize(32, 32)
-        self.speed_down.clicked.connect(self.decreaseSpeed)
-        self.speed_down.setStyleSheet(self.getSpeedButtonStyle())
-        speed_group_layout.addWidget(self.speed_down)
-        
-        # Speed display
-        self.speed_display = QtWidgets.QLabel("1x")
-        self.speed_display.setFixedSize(40, 32)
-        self.speed_display.setAlignment(Qt.AlignCenter)
-        self.speed_display.setStyleSheet("""
-            QLabel {
-                background-color: white;
-                border: 1px solid #ced4da;
-                color: #495057;
-                font-weight: bold;
-                font-size: 12px;
-            }
-        """)
-        speed_group_layout.addWidget(self.speed_display)
-        
-        # Increase button
-        self.speed_up = QtWidgets.QPushButton("+")
-        self.speed_up.setFixedSize(32, 32)
-        self.speed_up.clicked.connect(self.increaseSpeed)
-        self.speed_up.setStyleSheet(self.getSpeedButtonStyle())
-        speed_group_layout.addWidget(self.speed_up)
-        
-        speed_layout.addWidget(speed_group)
-        speed_container.setFixedHeight(34)
-        main_layout.addWidget(speed_container)
+        # Speed editor; the spin box auto-repeats on press-and-hold itself
+        self.speed_spin = QtWidgets.QSpinBox()
+        self.speed_spin.setObjectName("speedSpin")
+        self.speed_spin.setRange(1, 10)
+        self.speed_spin.setSuffix("x")
+        self.speed_spin.setValue(self.current_speed)
+        self.speed_spin.setAlignment(Qt.AlignCenter)
+        self.speed_spin.setFixedSize(64, 32)
+        self.speed_spin.valueChanged.connect(self._onSpeedSpin)
+        speed_layout.addWidget(self.speed_spin)
+        main_layout.addLayout(speed_layout)
         
     def setupZoomSection(self, main_layout):
         """Setup zoom control section with compact layout"""
-        zoom_container = QtWidgets.QWidget()
-        zoom_layout = QtWidgets.QHBoxLayout(zoom_container)
+        zoom_layout = QtWidgets.QHBoxLayout()
         zoom_layout.setContentsMargins(0, 0, 0, 0)
         zoom_layout.setSpacing(6)  # Reduced spacing
         
         # Section label
         zoom_label = QtWidgets.QLabel("Zoom")
-        zoom_label.setStyleSheet("color: #6c757d; font-weight: bold; font-size: 10px;")
+        zoom_label.setObjectName("zoomLabel")
         zoom_layout.addWidget(zoom_label)
         
         # Zoom widget - more compact
         self.zoom_widget = widgets.ZoomWidget(self)
+        self.zoom_widget.setObjectName("zoomWidget")
         # Ensure enough width to avoid clipping internal slider/spinbox
         self.zoom_widget.setFixedHeight(32)
         self.zoom_widget.setMinimumWidth(260)
-        self.zoom_widget.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
-        self.zoom_widget.valueChanged.connect(self.zoomChanged.emit)
-        self.zoom_widget.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border: 1px solid #ced4da;
-                height: 5px;
-                background: white;
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background: #495057;
-                border: 1px solid #343a40;
-                width: 12px;
-                height: 12px;
-                border-radius: 6px;
-                margin: -4px 0;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #343a40;
-            }
-            QSpinBox {
-                background-color: white;
-                border: 1px solid #ced4da;
-                border-radius: 3px;
-                padding: 2px 4px;
-                font-size: 10px;
-                max-width: 45px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                width: 0px;
-            }
-            QToolButton {
-                background-color: white;
-                border: 1px solid #ced4da;
-                border-radius: 3px;
-                padding: 2px 4px;
-                font-size: 10px;
-            }
-        """)
+        self.zoom_widget.setSizePolicy(_SP_PREFERRED_FIXED)
+        self.zoom_widget.valueChanged.connect(self._queueZoomChanged)
         zoom_layout.addWidget(self.zoom_widget)
         # Allow the zoom widget to take available horizontal space within its section
         zoom_layout.setStretch(0, 0)
         zoom_layout.setStretch(1, 1)
-        
-        zoom_container.setFixedHeight(34)
-        zoom_container.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
-        main_layout.addWidget(zoom_container)
+        main_layout.addLayout(zoom_layout)
         
     def setupPerformanceSection(self, main_layout):
         """Setup performance metrics section"""
@@ -235,178 +354,75 @@ class ModernHeaderWidget(QtWidgets.QWidget):
         
         # Section label
         perf_label = QtWidgets.QLabel("Score")
-        perf_label.setStyleSheet("color: #6c757d; font-weight: bold; font-size: 11px;")
+        perf_label.setObjectName("sectionLabel")
         perf_layout.addWidget(perf_label)
         
         # Score display
-        self.score_display = QtWidgets.QLCDNumber()
-        self.score_display.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.score_display.setSegmentStyle(QtWidgets.QLCDNumber.Flat)
-        self.score_display.setNumDigits(5)
+        self.score_display = QtWidgets.QLabel(self._formatScore(self._score))
+        self.score_display.setObjectName("scoreDisplay")
+        self.score_display.setAlignment(Qt.AlignCenter)
         self.score_display.setFixedSize(80, 32)
-        self.score_display.setStyleSheet("""
-            QLCDNumber {
-                background-color: white;
-                border: 1px solid #ced4da;
-                border-radius: 3px;
-                color: #495057;
-            }
-        """)
         perf_layout.addWidget(self.score_display)
         
         self.perf_container.setFixedHeight(34)
         main_layout.addWidget(self.perf_container)
-        # Hide the score section in the header by default
-        self.perf_container.setVisible(False)
         
     def setupTimeSection(self, main_layout):
         """Setup time control section"""
-        time_container = QtWidgets.QWidget()
-        time_layout = QtWidgets.QHBoxLayout(time_container)
+        time_layout = QtWidgets.QHBoxLayout()
         time_layout.setContentsMargins(0, 0, 0, 0)
         time_layout.setSpacing(8)
         
         # Section label
         time_label = QtWidgets.QLabel("Time")
-        time_label.setStyleSheet("color: #6c757d; font-weight: bold; font-size: 11px;")
+        time_label.setObjectName("sectionLabel")
         time_layout.addWidget(time_label)
         
         # Pause/Start button
         self.pause_btn = QtWidgets.QPushButton("Start")
+        self.pause_btn.setObjectName("pauseBtn")
+        # Not polished yet, so setting the state is enough for the first look
+        self.pause_btn.setProperty("state", "paused")
         self.pause_btn.setCheckable(True)
         self.pause_btn.setChecked(True)  # Initially paused
         self.pause_btn.clicked.connect(self.togglePause)
         self.pause_btn.setFixedSize(60, 32)
-        self.updatePauseButtonStyle()
         time_layout.addWidget(self.pause_btn)
 
         # Restart button
         self.restart_btn = QtWidgets.QPushButton("Restart")
+        self.restart_btn.setObjectName("restartBtn")
         self.restart_btn.setFixedSize(70, 32)
-        self.restart_btn.setStyleSheet(self.getButtonStyle())
-        self.restart_btn.clicked.connect(self.restartRequested.emit)
+        self.restart_btn.clicked.connect(self.restartRequested)
         time_layout.addWidget(self.restart_btn)
         
         # Clock display
         self.clock_widget = widgets.ClockWidget(self)
+        self.clock_widget.setObjectName("clockWidget")
         self.clock_widget.setFixedSize(90, 32)
-        self.clock_widget.setStyleSheet("""
-            QLCDNumber {
-                background-color: #343a40;
-                border: 1px solid #495057;
-                border-radius: 3px;
-                color: white;
-                font-size: 12px;
-            }
-        """)
         time_layout.addWidget(self.clock_widget)
-        
-        time_container.setFixedHeight(34)
-        main_layout.addWidget(time_container)
+        main_layout.addLayout(time_layout)
         
     def setupTitleSection(self, main_layout):
         """Setup simulation title section with responsive sizing"""
-        title_container = QtWidgets.QWidget()
-        title_layout = QtWidgets.QHBoxLayout(title_container)
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        
         self.title_label = QtWidgets.QLabel("TrackTitans - No simulation loaded")
+        self.title_label.setObjectName("titleLabel")
         self.title_label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
         self.title_label.setFixedHeight(32)
         # Responsive width - minimum needed, maximum reasonable
         self.title_label.setMinimumWidth(200)  # Reduced minimum
         self.title_label.setMaximumWidth(400)  # Set reasonable maximum
         # Allow the title to shrink and expand as needed
-        self.title_label.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                background-color: white;
-                border: 1px solid #ced4da;
-                border-radius: 3px;
-                padding: 6px 10px;
-                color: #495057;
-                font-size: 12px;
-                font-weight: 500;
-            }
-        """)
-        title_layout.addWidget(self.title_label)
-        
-        title_container.setFixedHeight(34)
-        title_container.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
-        main_layout.addWidget(title_container)
-        
-    def getButtonStyle(self):
-        """Get standard button style"""
-        return """
-            QPushButton {
-                background-color: white;
-                border: 1px solid #ced4da;
-                border-radius: 3px;
-                padding: 8px 12px;
-                color: #495057;
-                font-weight: 500;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-                border-color: #adb5bd;
-            }
-            QPushButton:pressed {
-                background-color: #dee2e6;
-            }
-        """
-        
-    def getSpeedButtonStyle(self):
-        """Get speed button style"""
-        return """
-            QPushButton {
-                background-color: white;
-                border: 1px solid #ced4da;
-                border-radius: 3px;
-                color: #495057;
-                font-weight: bold;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-            }
-            QPushButton:pressed {
-                background-color: #dee2e6;
-            }
-        """
+        self.title_label.setSizePolicy(_SP_PREFERRED_FIXED)
+        main_layout.addWidget(self.title_label)
         
     def updatePauseButtonStyle(self):
         """Update pause button style based on state"""
-        if self.is_paused:
-            self.pause_btn.setText("Start")
-            self.pause_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #28a745;
-                    border: 1px solid #28a745;
-                    border-radius: 3px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #218838;
-                }
-            """)
-        else:
-            self.pause_btn.setText("Pause")
-            self.pause_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffc107;
-                    border: 1px solid #ffc107;
-                    border-radius: 3px;
-                    color: #212529;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #e0a800;
-                }
-            """)
+        self.pause_btn.setText("Start" if self.is_paused else "Pause")
+        self.pause_btn.setProperty("state", "paused" if self.is_paused else "running")
+        style = self.pause_btn.style()
+        style.unpolish(self.pause_btn)
+        style.polish(self.pause_btn)
             
     def togglePause(self):
         """Toggle pause state"""
@@ -416,31 +432,41 @@ class ModernHeaderWidget(QtWidgets.QWidget):
         
     def setPauseState(self, paused):
         """Set pause state externally"""
+        if paused == self.is_paused:
+            return
         self.is_paused = paused
         self.pause_btn.setChecked(paused)
         self.updatePauseButtonStyle()
         
-    def increaseSpeed(self):
-        """Increase simulation speed"""
-        if self.current_speed < 10:
-            self.current_speed += 1
-            self.speed_display.setText(f"{self.current_speed}x")
-            self.speedChanged.emit(self.current_speed)
-            
-    def decreaseSpeed(self):
-        """Decrease simulation speed"""
-        if self.current_speed > 1:
-            self.current_speed -= 1
-            self.speed_display.setText(f"{self.current_speed}x")
-            self.speedChanged.emit(self.current_speed)
+    def _onSpeedSpin(self, value):
+        self.current_speed = value
+        self._speed_emit_timer.start()
+
+    def _emitSpeedChanged(self):
+        self.speedChanged.emit(self.current_speed)
+
+    def _queueZoomChanged(self, value):
+        self._zoom_value = value
+        self._zoom_emit_timer.start()
+
+    def _emitZoomChanged(self):
+        self.zoomChanged.emit(self._zoom_value)
             
     def setSpeed(self, speed):
         """Set speed externally"""
-        self.current_speed = max(1, min(10, speed))
-        self.speed_display.setText(f"{self.current_speed}x")
+        speed = 1 if speed < 1 else 10 if speed > 10 else speed
+        if speed == self.current_speed:
+            return
+        self.current_speed = speed
+        self.speed_spin.blockSignals(True)
+        self.speed_spin.setValue(speed)
+        self.speed_spin.blockSignals(False)
         
     def setSimulationTitle(self, title):
         """Update simulation title"""
+        if title == self._last_title:
+            return
+        self._last_title = title
         if title:
             self.title_label.setText(f"TrackTitans - {title}")
         else:
@@ -448,18 +474,38 @@ class ModernHeaderWidget(QtWidgets.QWidget):
             
     def setScore(self, score):
         """Update penalty score"""
-        self.score_display.display(score)
+        if score == self._score:
+            return
+        self._score = score
+        self._flushScore()
+
+    def _flushScore(self):
+        """Show the stored score if the score display is on screen"""
+        if self.perf_container is not None and self.perf_container.isVisible():
+            self.score_display.setText(self._formatScore(self._score))
+
+    @staticmethod
+    def _formatScore(score):
+        """Format the score as the five digits the LCD display used to show"""
+        return f"{int(score):05d}"
         
     def setTime(self, time):
         """Update clock time"""
+        if not self.isVisible():
+            self._pending_time = time
+            return
+        self._pending_time = None
         self.clock_widget.setTime(time)
         
     def setControlsEnabled(self, enabled):
         """Enable/disable controls"""
-        self.open_btn.setEnabled(enabled)
-        self.edit_btn.setEnabled(enabled)
-        self.speed_up.setEnabled(enabled)
-        self.speed_down.setEnabled(enabled)
-        self.pause_btn.setEnabled(enabled)
-        self.restart_btn.setEnabled(enabled)
-        self.zoom_widget.setEnabled(enabled)
+        self._controls_enabled = enabled
+        self._edit_enabled = enabled
+        for control in self._controls:
+            control.setEnabled(enabled)
+
+    def setEditEnabled(self, enabled):
+        """Enable/disable the editor action only"""
+        self._edit_enabled = enabled
+        if self.edit_btn is not None:
+            self.edit_btn.setEnabled(enabled)
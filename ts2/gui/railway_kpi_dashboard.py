@@ -18,86 +18,371 @@
 #   59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
 #
 
+import csv
+import functools
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
 from Qt import QtCore, QtWidgets, Qt, QtGui
 from datetime import datetime, timedelta
 from .charts import (LineChart, KPITile)
 from .analytics_provider import KPIDataProvider
 
 
+# Historical metrics as parallel tuples: key, display name and unit
+_METRIC_KEYS = ("punctuality", "averageDelay", "p90Delay", "throughput",
+                "utilization", "acceptanceRate", "openConflicts",
+                "headwayAdherence", "headwayBreaches")
+_METRIC_NAMES = ("Right-Time Performance", "Average Delay", "P90 Delay",
+                 "Throughput", "Utilization", "Acceptance Rate",
+                 "Open Conflicts", "Headway Adherence", "Headway Breaches")
+_METRIC_UNITS = ("%", "min", "min", "tr/h", "%", "%", "count", "%", "count")
+_METRIC_IDX = {key: i for i, key in enumerate(_METRIC_KEYS)}
+
+# Trend chart groups: (title, metrics, accent color)
+_METRIC_GROUPS = (
+    ("Performance Metrics", ("punctuality", "averageDelay", "p90Delay"), "#10b981"),
+    ("Operational Metrics", ("throughput", "utilization", "acceptanceRate"), "#3b82f6"),
+    ("Reliability Metrics", ("openConflicts", "headwayAdherence", "headwayBreaches"), "#f59e0b"),
+)
+
+# Static style sheets, parsed from these constants rather than rebuilt per setup
+_DASHBOARD_CSS = """
+    QWidget {
+        background-color: #f8fafc;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    }
+"""
+
+_SCROLL_CSS = """
+    QScrollArea {
+        border: none;
+        background-color: #f8fafc;
+    }
+    QScrollBar:vertical {
+        background: #e2e8f0;
+        width: 8px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background: #cbd5e1;
+        border-radius: 4px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #94a3b8;
+    }
+"""
+
+_EXPORT_BTN_CSS = """
+    QPushButton {
+        background-color: #f3f4f6;
+        color: #374151;
+        border: 1px solid #d1d5db;
+        padding: 6px 12px;
+        border-radius: 6px;
+        font-weight: 500;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #e5e7eb;
+    }
+    QPushButton:pressed {
+        background-color: #d1d5db;
+    }
+"""
+
+# Caption in front of a selector combo, and the margin under each controls row
+_CONTROL_LABEL_CSS = "color: #64748b; font-weight: 500; font-size: 14px;"
+_CONTROLS_ROW_CSS = "margin-bottom: 16px;"
+
+_STATUS_LABEL_CSS = """
+    color: #9ca3af; 
+    font-size: 12px; 
+    font-weight: 400;
+"""
+
+_CHART_TITLE_CSS = """
+    font-size: 16px;
+    font-weight: 600;
+    color: #1e293b;
+"""
+
+_CHART_CSS = """
+    QWidget {
+        border-radius: 8px;
+        background-color: #fafbfc;
+    }
+"""
+
+_COMBO_CSS = """
+    QComboBox {
+        padding: 8px 12px;
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        background-color: white;
+        font-size: 14px;
+        color: #374151;
+        min-width: 120px;
+    }
+    QComboBox:hover {
+        border-color: #9ca3af;
+    }
+    QComboBox:focus {
+        border-color: #6b7280;
+        outline: none;
+    }
+    QComboBox QAbstractItemView {
+        border: 1px solid #d1d5db;
+        background-color: white;
+        selection-background-color: #e5e7eb;
+        selection-color: #374151;
+    }
+    QComboBox QAbstractItemView::item {
+        padding: 8px 12px;
+        color: #374151;
+    }
+    QComboBox QAbstractItemView::item:selected {
+        background-color: #e5e7eb;
+        color: #374151;
+    }
+"""
+
+# Group header and chart card styles per accent
+_GROUP_HEADER_STYLES = {
+    accent: f"""
+        font-size: 18px;
+        font-weight: 600;
+        color: {accent};
+        margin: 16px 0 8px 0;
+        padding: 8px 0;
+        border-bottom: 2px solid {accent};
+    """
+    for _title, _metrics, accent in _METRIC_GROUPS
+}
+
+_CHART_CARD_STYLES = {
+    accent: f"""
+        QWidget {{
+            background-color: white;
+            border-radius: 16px;
+            border: 2px solid #f1f5f9;
+            padding: 0;
+        }}
+        QWidget:hover {{
+            border-color: {accent};
+        }}
+    """
+    for _title, _metrics, accent in _METRIC_GROUPS
+}
+
+# Unit badge style per accent, with the accent as a translucent background
+_UNIT_STYLES = {
+    accent: f"""
+        font-size: 12px;
+        font-weight: 600;
+        color: {accent};
+        background-color: rgba({int(accent[1:3], 16)}, {int(accent[3:5], 16)}, {int(accent[5:7], 16)}, 0.1);
+        padding: 4px 8px;
+        border-radius: 12px;
+    """
+    for _title, _metrics, accent in _METRIC_GROUPS
+}
+
+# Combo box texts -> API parameters
+_PERIOD_API = {"Hourly": "hourly", "Daily": "daily", "Weekly": "weekly"}
+_TIME_RANGE_API = {
+    "Last Hour": "1h",
+    "Last 6 Hours": "6h",
+    "Today": "1d",
+    "Last 24h": "1d",
+    "Last Week": "1w",
+    "Last Month": "1m",
+}
+_TRAIN_TYPE_API = {
+    "All Classes": "all",
+    "Mail/Express": "express",
+    "Suburban": "regional",
+    "Freight": "freight",
+}
+
+# KPI tiles in grid order: (tile_key, api_key, title, unit)
+_KPI_TILES = (
+    ("punctuality", "punctuality", "Right-Time Performance", "%"),
+    ("averageDelay", "averageDelay", "Avg Delay", "min"),
+    ("p90Delay", "p90Delay", "P90 Delay", "min"),
+    ("throughput", "throughput", "Throughput", "tr/h"),
+    ("openConflicts", "openConflicts", "Open Conflicts", "count"),
+    ("mttrConflict", "mttrConflict", "MTTR-Conflict", "min"),
+    ("acceptanceRate", "acceptanceRate", "Acceptance Rate", "%"),
+    ("utilization", "utilization", "Utilization", "%"),
+    ("headwayAdherence", "headwayAdherence", "Headway Adherence", "%"),
+    ("headwayBreaches", "headwayBreaches", "Headway Breaches", "count"),
+    ("efficiency", "efficiency", "Operational Efficiency", "%"),
+    ("performance", "performance", "System Performance", "%"),
+)
+
+# KPI tile colour thresholds: tile_key -> (green, red, lower is better)
+_KPI_THRESHOLDS = {
+    "punctuality": (85, 75, False),
+    "headwayAdherence": (95, 90, False),
+    "averageDelay": (6, 8, True),
+    "p90Delay": (12, 15, True),
+    "mttrConflict": (5, 10, True),
+    "openConflicts": (2, 4, True),
+    "headwayBreaches": (2, 4, True),
+    "acceptanceRate": (70, 50, False),
+    "efficiency": (90, 80, False),
+    "performance": (80, 60, False),
+}
+
+
+def _signedDelta(trend):
+    """Trend entry {change, direction} -> signed change, or None"""
+    change = trend.get("change") if isinstance(trend, dict) else None
+    if not isinstance(change, (int, float)):
+        return None
+    direction = trend.get("direction")
+    if direction == "DOWN":
+        return -abs(change)
+    if direction == "UP":
+        return abs(change)
+    return change
+
+
 class RailwayKPIDashboard(QtWidgets.QWidget):
     """Minimal Operations Analytics Dashboard (API-driven)"""
+
+    SERIES_COLOR = QtGui.QColor(73, 80, 87)
+    TARGET_COLOR = QtGui.QColor(134, 142, 150)
+
+    # Granularity (seconds) of the "as of" time sent with KPI requests
+    AS_OF_BUCKETS = {"1h": 60, "6h": 60, "1d": 300, "1w": 3600, "1m": 3600}
+
+    # Polling interval, doubled per consecutive provider error up to the cap
+    REFRESH_INTERVAL = 15000
+    MAX_REFRESH_INTERVAL = 5 * 60 * 1000
+
+    # Report export results, emitted from the writer thread
+    exportFinished = QtCore.pyqtSignal(str)
+    exportFailed = QtCore.pyqtSignal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.kpi_tiles = {}
-        self.kpi_config = []  # (tile_key, api_key, title, unit)
         self.provider = KPIDataProvider()
         self.provider.kpisUpdated.connect(self.onKpisUpdated)
         self.provider.historicalUpdated.connect(self.onHistoricalUpdated)
+        self.provider.historicalBatchUpdated.connect(self.onHistoricalBatchUpdated)
+        self.provider.bundleUpdated.connect(self.onBundleUpdated)
         self.provider.errorOccurred.connect(self.onProviderError)
+        self.provider.snapshotReceived.connect(self.onSnapshotReceived)
+        self.provider.streamStatusChanged.connect(self.onStreamStatusChanged)
+        self.exportFinished.connect(self._onExportFinished)
+        self.exportFailed.connect(self._onExportFailed)
+        self._stream_live = False
         self._provider_errors = 0
-        # Charts map and metadata for historical metrics
+        # Charts map for historical metrics; charts are built when their
+        # placeholder first scrolls into view
         self.charts_by_metric = {}
-        self.metrics_for_history = [
-            "punctuality", "averageDelay", "p90Delay", "throughput",
-            "utilization", "acceptanceRate", "openConflicts",
-            "headwayAdherence", "headwayBreaches"
-        ]
-        self.metric_meta = {
-            "punctuality": {"name": "Right-Time Performance", "unit": "%"},
-            "averageDelay": {"name": "Average Delay", "unit": "min"},
-            "p90Delay": {"name": "P90 Delay", "unit": "min"},
-            "throughput": {"name": "Throughput", "unit": "tr/h"},
-            "utilization": {"name": "Utilization", "unit": "%"},
-            "acceptanceRate": {"name": "Acceptance Rate", "unit": "%"},
-            "openConflicts": {"name": "Open Conflicts", "unit": "count"},
-            "headwayAdherence": {"name": "Headway Adherence", "unit": "%"},
-            "headwayBreaches": {"name": "Headway Breaches", "unit": "count"},
-        }
+        self._chart_placeholders = {}  # metric: (placeholder, unit, card_layout)
+        self._last_series = {}  # metric: values last pushed to its chart
+        self._last_tile_state = {}  # tile_key: (value, delta) last shown
+        self.metrics_for_history = _METRIC_KEYS
+        # Refresh triggers (timer, combo changes) arriving within 300 ms
+        # are coalesced; the dirty flags say which fetches are owed
+        self._kpis_dirty = False
+        self._hist_dirty = False
+        # Requests sent and not yet answered; at most one of each at a time
+        self._kpi_inflight = False
+        self._hist_inflight = False
+        self._refresh_pending = QtCore.QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(300)
+        self._refresh_pending.timeout.connect(self._doRefresh)
+        # Provider errors are reported once per burst, in the status label
+        self._error_buffer = []
+        self._error_flush_timer = QtCore.QTimer(self)
+        self._error_flush_timer.setSingleShot(True)
+        self._error_flush_timer.setInterval(1000)
+        self._error_flush_timer.timeout.connect(self._flushErrors)
+        # Responses received while hidden, applied on the next show
+        self._pending_kpis = None
+        self._pending_history = {}
+        self._was_hidden = False
+        # Report files are written on this worker, one export at a time
+        self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kpi-export")
         self.setupUI()
         self.requestDataRefresh()
         
-        # Auto-refresh timer
+        # Auto-refresh timer, running only while the dashboard is shown and
+        # the server's snapshot stream (also only open while shown) is not
+        # connected
         self.refresh_timer = QtCore.QTimer()
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
         self.refresh_timer.timeout.connect(self.requestDataRefresh)
-        self.refresh_timer.start(15000)  # 15 seconds
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._onApplicationStateChanged)
         
+    def showEvent(self, event):
+        """Resume polling and apply the responses that arrived while hidden"""
+        super().showEvent(event)
+        self.provider.startStream()
+        if not self._stream_live:
+            self.refresh_timer.start()
+        if self._pending_kpis is not None:
+            data, self._pending_kpis = self._pending_kpis, None
+            self.onKpisUpdated(data)
+        pending, self._pending_history = self._pending_history, {}
+        for metric, data in pending.items():
+            self.onHistoricalUpdated(metric, data)
+        if self._was_hidden:
+            self._was_hidden = False
+            self.requestDataRefresh()
+        # Children are laid out by the time the event loop comes back
+        QtCore.QTimer.singleShot(0, self._maybeRealizeCharts)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._chart_placeholders:
+            QtCore.QTimer.singleShot(0, self._maybeRealizeCharts)
+
+    def hideEvent(self, event):
+        """Stop polling while the dashboard is not on screen"""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+        self.provider.stopStream()
+        # Poll on the next show until the reopened stream reports in
+        self._stream_live = False
+        self._was_hidden = True
+
+    def _onApplicationStateChanged(self, state):
+        """Pause polling while the application is hidden or suspended"""
+        if state in (QtCore.Qt.ApplicationHidden, QtCore.Qt.ApplicationSuspended):
+            self.refresh_timer.stop()
+            self._was_hidden = True
+        elif self.isVisible() and not self.refresh_timer.isActive():
+            if not self._stream_live:
+                self.refresh_timer.start()
+            if self._was_hidden:
+                self._was_hidden = False
+                self.requestDataRefresh()
+
     def setupUI(self):
         """Setup modern analytics dashboard UI"""
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Set modern background
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8fafc;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            }
-        """)
+        self.setStyleSheet(_DASHBOARD_CSS)
 
         # Scrollable container with modern styling
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #f8fafc;
-            }
-            QScrollBar:vertical {
-                background: #e2e8f0;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #cbd5e1;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #94a3b8;
-            }
-        """)
+        scroll.setStyleSheet(_SCROLL_CSS)
         
         content = QtWidgets.QWidget()
         content_layout = QtWidgets.QVBoxLayout(content)
@@ -115,6 +400,8 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
 
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
+        self._scroll = scroll
+        scroll.verticalScrollBar().valueChanged.connect(self._maybeRealizeCharts)
         
     def setupHeader(self, main_layout):
         """Setup minimal header with essential controls only"""
@@ -123,53 +410,33 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
         
         # Time range selector with minimal styling
         range_label = QtWidgets.QLabel("Time Range")
-        range_label.setStyleSheet("color: #64748b; font-weight: 500; font-size: 14px;")
+        range_label.setStyleSheet(_CONTROL_LABEL_CSS)
         controls_row.addWidget(range_label)
         
         self.time_combo = QtWidgets.QComboBox()
         self.time_combo.addItems(["Last Hour", "Last 6 Hours", "Today", "Last 24h", "Last Week", "Last Month"])
         self.time_combo.setCurrentText("Today")
-        self.time_combo.setStyleSheet(self._getModernComboBoxStyle("#3b82f6"))
+        self.time_combo.setStyleSheet(_COMBO_CSS)
         controls_row.addWidget(self.time_combo)
-        self.time_combo.currentTextChanged.connect(self.requestDataRefresh)
+        self.time_combo.currentTextChanged.connect(self._onTimeRangeChanged)
         
         controls_row.addStretch()
         
         # Status indicator (minimal)
         self.updated_label = QtWidgets.QLabel("Updated: --")
-        self.updated_label.setStyleSheet("""
-            color: #9ca3af; 
-            font-size: 12px; 
-            font-weight: 400;
-        """)
+        self.updated_label.setStyleSheet(_STATUS_LABEL_CSS)
         controls_row.addWidget(self.updated_label)
         
         # Export button (minimal)
         self.export_btn = QtWidgets.QPushButton("Export")
         self.export_btn.clicked.connect(self.exportReport)
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f3f4f6;
-                color: #374151;
-                border: 1px solid #d1d5db;
-                padding: 6px 12px;
-                border-radius: 6px;
-                font-weight: 500;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #e5e7eb;
-            }
-            QPushButton:pressed {
-                background-color: #d1d5db;
-            }
-        """)
+        self.export_btn.setStyleSheet(_EXPORT_BTN_CSS)
         controls_row.addWidget(self.export_btn)
         
         # Add controls with minimal spacing
         controls_container = QtWidgets.QWidget()
         controls_container.setLayout(controls_row)
-        controls_container.setStyleSheet("margin-bottom: 16px;")
+        controls_container.setStyleSheet(_CONTROLS_ROW_CSS)
         
         main_layout.addWidget(controls_container)
         
@@ -181,29 +448,25 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
         grid.setHorizontalSpacing(16)
         grid.setVerticalSpacing(16)
 
-        # Define KPI tiles: (tile_key, api_key, title, unit)
-        self.kpi_config = [
-            ("punctuality", "punctuality", "Right-Time Performance", "%"),
-            ("averageDelay", "averageDelay", "Avg Delay", "min"),
-            ("p90Delay", "p90Delay", "P90 Delay", "min"),
-            ("throughput", "throughput", "Throughput", "tr/h"),
-            ("openConflicts", "openConflicts", "Open Conflicts", "count"),
-            ("mttrConflict", "mttrConflict", "MTTR-Conflict", "min"),
-            ("acceptanceRate", "acceptanceRate", "Acceptance Rate", "%"),
-            ("utilization", "utilization", "Utilization", "%"),
-            ("headwayAdherence", "headwayAdherence", "Headway Adherence", "%"),
-            ("headwayBreaches", "headwayBreaches", "Headway Breaches", "count"),
-            ("efficiency", "efficiency", "Operational Efficiency", "%"),
-            ("performance", "performance", "System Performance", "%"),
-        ]
-
+        # Per-tile update recipe, resolved once: (api_key, tile_key, tile, color_fn)
+        self._tile_updaters = []
         cols = 4
-        for idx, (tile_key, api_key, title, unit) in enumerate(self.kpi_config):
+        for idx, (tile_key, api_key, title, unit) in enumerate(_KPI_TILES):
             tile = KPITile(title, "--", unit)
             self.kpi_tiles[tile_key] = tile
             r = idx // cols
             c = idx % cols
             grid.addWidget(tile, r, c)
+
+            # Minimal color rules per metric
+            thresholds = _KPI_THRESHOLDS.get(tile_key)
+            if thresholds is None:
+                color_fn = self._neutralKPIColor
+            else:
+                green, red, reverse = thresholds
+                color_fn = functools.partial(self.getKPIColor, green_threshold=green,
+                                             red_threshold=red, reverse=reverse)
+            self._tile_updaters.append((api_key, tile_key, tile, color_fn))
             
         main_layout.addWidget(kpi_container)
         
@@ -213,13 +476,13 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
         period_row = QtWidgets.QHBoxLayout()
         
         period_label = QtWidgets.QLabel("Period")
-        period_label.setStyleSheet("color: #64748b; font-weight: 500; font-size: 14px;")
+        period_label.setStyleSheet(_CONTROL_LABEL_CSS)
         period_row.addWidget(period_label)
         
         self.period_combo = QtWidgets.QComboBox()
         self.period_combo.addItems(["Hourly", "Daily", "Weekly"])
         self.period_combo.setCurrentText("Hourly")
-        self.period_combo.setStyleSheet(self._getModernComboBoxStyle("#10b981"))
+        self.period_combo.setStyleSheet(_COMBO_CSS)
         self.period_combo.currentTextChanged.connect(self._onPeriodChanged)
         period_row.addWidget(self.period_combo)
         
@@ -228,7 +491,7 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
         # Add period selector with minimal spacing
         period_container = QtWidgets.QWidget()
         period_container.setLayout(period_row)
-        period_container.setStyleSheet("margin-bottom: 16px;")
+        period_container.setStyleSheet(_CONTROLS_ROW_CSS)
         
         main_layout.addWidget(period_container)
 
@@ -240,53 +503,26 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
         charts_grid.setContentsMargins(0, 0, 0, 0)
         charts_grid.setSpacing(20)
 
-        # Group metrics by category for better layout
-        performance_metrics = ["punctuality", "averageDelay", "p90Delay"]
-        operational_metrics = ["throughput", "utilization", "acceptanceRate"]
-        reliability_metrics = ["openConflicts", "headwayAdherence", "headwayBreaches"]
-        
-        metric_groups = [
-            ("Performance Metrics", performance_metrics, "#10b981"),
-            ("Operational Metrics", operational_metrics, "#3b82f6"), 
-            ("Reliability Metrics", reliability_metrics, "#f59e0b")
-        ]
-
         row = 0
-        for group_name, metrics, accent_color in metric_groups:
+        for group_name, metrics, accent_color in _METRIC_GROUPS:
             # Group header
             group_header = QtWidgets.QLabel(group_name)
-            group_header.setStyleSheet(f"""
-                font-size: 18px;
-                font-weight: 600;
-                color: {accent_color};
-                margin: 16px 0 8px 0;
-                padding: 8px 0;
-                border-bottom: 2px solid {accent_color};
-            """)
+            group_header.setStyleSheet(_GROUP_HEADER_STYLES[accent_color])
             charts_grid.addWidget(group_header, row, 0, 1, 2)
             row += 1
             
             # Charts in this group (2 per row)
             col = 0
             for metric in metrics:
-                if metric not in self.metrics_for_history:
+                i = _METRIC_IDX.get(metric, -1)
+                if i < 0:
                     continue
-                    
-                meta = self.metric_meta.get(metric, {"name": metric, "unit": ""})
+                name = _METRIC_NAMES[i]
+                unit = _METRIC_UNITS[i]
                 
                 # Enhanced chart card
                 chart_card = QtWidgets.QWidget()
-                chart_card.setStyleSheet(f"""
-                    QWidget {{
-                        background-color: white;
-                        border-radius: 16px;
-                        border: 2px solid #f1f5f9;
-                        padding: 0;
-                    }}
-                    QWidget:hover {{
-                        border-color: {accent_color};
-                    }}
-                """)
+                chart_card.setStyleSheet(_CHART_CARD_STYLES[accent_color])
                 card_layout = QtWidgets.QVBoxLayout(chart_card)
                 card_layout.setContentsMargins(20, 20, 20, 20)
                 card_layout.setSpacing(16)
@@ -294,42 +530,24 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
                 # Chart header with value and trend
                 header_row = QtWidgets.QHBoxLayout()
                 
-                chart_title = QtWidgets.QLabel(meta['name'])
-                chart_title.setStyleSheet("""
-                    font-size: 16px;
-                    font-weight: 600;
-                    color: #1e293b;
-                """)
+                chart_title = QtWidgets.QLabel(name)
+                chart_title.setStyleSheet(_CHART_TITLE_CSS)
                 header_row.addWidget(chart_title)
                 
                 header_row.addStretch()
                 
-                unit_label = QtWidgets.QLabel(meta['unit'])
-                unit_label.setStyleSheet(f"""
-                    font-size: 12px;
-                    font-weight: 600;
-                    color: {accent_color};
-                    background-color: rgba({int(accent_color[1:3], 16)}, {int(accent_color[3:5], 16)}, {int(accent_color[5:7], 16)}, 0.1);
-                    padding: 4px 8px;
-                    border-radius: 12px;
-                """)
+                unit_label = QtWidgets.QLabel(unit)
+                unit_label.setStyleSheet(_UNIT_STYLES[accent_color])
                 header_row.addWidget(unit_label)
                 
                 card_layout.addLayout(header_row)
 
-                # Chart with enhanced styling
-                chart = LineChart()
-                chart.setFixedHeight(260)  # Increased height to prevent clipping
-                chart.setAxisLabels("Time", meta.get("unit", ""))
-                chart.setStyleSheet("""
-                    QWidget {
-                        border-radius: 8px;
-                        background-color: #fafbfc;
-                    }
-                """)
-                card_layout.addWidget(chart)
-
-                self.charts_by_metric[metric] = chart
+                # Chart area; the LineChart is built on first view
+                placeholder = QtWidgets.QWidget()
+                placeholder.setFixedHeight(260)
+                card_layout.addWidget(placeholder)
+
+                self._chart_placeholders[metric] = (placeholder, unit, card_layout)
                 charts_grid.addWidget(chart_card, row, col)
                 
                 col += 1
@@ -342,195 +560,307 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
 
         main_layout.addWidget(charts_container)
         
+    def _maybeRealizeCharts(self):
+        """Build the charts whose placeholders are now on screen"""
+        realized = [metric for metric, (placeholder, _unit, _layout)
+                    in self._chart_placeholders.items()
+                    if not placeholder.visibleRegion().isEmpty()]
+        if not realized:
+            return
+        for metric in realized:
+            self._realizeChart(metric)
+        if not self._chart_placeholders:
+            self._scroll.verticalScrollBar().valueChanged.disconnect(self._maybeRealizeCharts)
+        self._hist_dirty = True
+        self._refresh_pending.start()
+
+    def _realizeChart(self, metric):
+        """Swap a chart placeholder for the real LineChart"""
+        placeholder, unit, card_layout = self._chart_placeholders.pop(metric)
+        # Chart with enhanced styling
+        chart = LineChart()
+        chart.setFixedHeight(260)  # Increased height to prevent clipping
+        chart.setAxisLabels("Time", unit)
+        chart.setStyleSheet(_CHART_CSS)
+        # Optional target lines for certain metrics (minimal)
+        if metric == "punctuality":
+            chart.setStaticTarget(85, self.TARGET_COLOR, "Target (85%)")
+        card_layout.replaceWidget(placeholder, chart)
+        placeholder.deleteLater()
+        self.charts_by_metric[metric] = chart
+
+    def _onTimeRangeChanged(self):
+        """Refetch KPIs only; historical series do not depend on the range"""
+        self._kpis_dirty = True
+        self._refresh_pending.start()
+
     def _onPeriodChanged(self):
         """Refetch all historical series when period changes"""
-        self.fetchAllHistorical()
+        self._hist_dirty = True
+        self._refresh_pending.start()
         
-    def _mapPeriodToApi(self, display_text):
+    @staticmethod
+    def _mapPeriodToApi(display_text):
         """Map display text to API parameter"""
-        mapping = {
-            "Hourly": "hourly",
-            "Daily": "daily", 
-            "Weekly": "weekly"
-        }
-        return mapping.get(display_text, "hourly")
-        
-    def _getModernComboBoxStyle(self, accent_color):
-        """Get minimal combo box styling - clean and simple"""
-        return f"""
-            QComboBox {{
-                padding: 8px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                background-color: white;
-                font-size: 14px;
-                color: #374151;
-                min-width: 120px;
-            }}
-            QComboBox:hover {{
-                border-color: #9ca3af;
-            }}
-            QComboBox:focus {{
-                border-color: #6b7280;
-                outline: none;
-            }}
-            QComboBox QAbstractItemView {{
-                border: 1px solid #d1d5db;
-                background-color: white;
-                selection-background-color: #e5e7eb;
-                selection-color: #374151;
-            }}
-            QComboBox QAbstractItemView::item {{
-                padding: 8px 12px;
-                color: #374151;
-            }}
-            QComboBox QAbstractItemView::item:selected {{
-                background-color: #e5e7eb;
-                color: #374151;
-            }}
-        """
+        return _PERIOD_API.get(display_text, "hourly")
         
     def updateAllKPIs(self):
         """Deprecated: analytics is fully server-driven."""
         pass
 
     def requestDataRefresh(self):
-        """Trigger provider refresh using current filters; fallback to mock after repeated errors."""
-        time_range = self._mapTimeRange(self.time_combo.currentText())
-        self.provider.refreshKpis(time_range=time_range)
-        # Refresh historical for all metrics
-        self.fetchAllHistorical()
+        """Schedule a refresh of KPIs and historical series"""
+        if not self.isVisible():
+            # Nothing would be drawn; showEvent refreshes instead
+            self._was_hidden = True
+            return
+        self._kpis_dirty = True
+        self._hist_dirty = True
+        self._refresh_pending.start()
+
+    def _doRefresh(self):
+        """Trigger provider refresh using current filters"""
+        if self._provider_errors > 3:
+            # Server struggling: probe with the KPI request alone; history
+            # is refetched once it answers again
+            self._hist_dirty = False
+        # A request still in flight stays owed until its answer is in
+        kpis_due = self._kpis_dirty and not self._kpi_inflight
+        hist_due = self._hist_dirty and not self._hist_inflight and bool(self._historyMetrics())
+        if kpis_due and hist_due:
+            # Both are owed: fetch them in a single round-trip
+            self._kpis_dirty = self._hist_dirty = False
+            self._kpi_inflight = self._hist_inflight = True
+            time_range = self._mapTimeRange(self.time_combo.currentText())
+            self.provider.fetchDashboardBundle(
+                time_range=time_range,
+                metrics=self._historyMetrics(),
+                period=self._mapPeriodToApi(self.period_combo.currentText()),
+                as_of=self._quantizedNow(time_range))
+            return
+        if kpis_due:
+            self._kpis_dirty = False
+            self._kpi_inflight = True
+            time_range = self._mapTimeRange(self.time_combo.currentText())
+            self.provider.refreshKpis(time_range=time_range,
+                                      as_of=self._quantizedNow(time_range))
+        if hist_due:
+            self._hist_dirty = False
+            self._hist_inflight = True
+            self.fetchAllHistorical()
+
+    def _requestDone(self, kpis=False, hist=False):
+        """Clear in-flight flags and send what became owed meanwhile"""
+        if kpis:
+            self._kpi_inflight = False
+        if hist:
+            self._hist_inflight = False
+        if (kpis and self._kpis_dirty) or (hist and self._hist_dirty):
+            self._refresh_pending.start()
+
+    def _historyMetrics(self):
+        """Metrics whose chart is built, in display order"""
+        return [m for m in self.metrics_for_history if m in self.charts_by_metric]
 
     def fetchAllHistorical(self):
-        """Fetch historical data for all configured metrics"""
-        period_display = getattr(self, "period_combo", None).currentText() if hasattr(self, "period_combo") else "Hourly"
-        period_api = self._mapPeriodToApi(period_display)
-        for m in self.metrics_for_history:
-            self.provider.fetchHistorical(metric=m, period=period_api)
-
-    def _mapTimeRange(self, text):
-        mapping = {
-            "Last Hour": "1h",
-            "Last 6 Hours": "6h",
-            "Today": "1d",
-            "Last 24h": "1d",
-            "Last Week": "1w",
-            "Last Month": "1m",
-        }
-        return mapping.get(text, "1d")
-
-    def _mapTrainType(self, text):
-        mapping = {
-            "All Classes": "all",
-            "Mail/Express": "express",
-            "Suburban": "regional",
-            "Freight": "freight",
-        }
-        return mapping.get(text, "all")
+        """Fetch historical data for every metric whose chart is built"""
+        metrics = self._historyMetrics()
+        if not metrics:
+            return
+        period_api = self._mapPeriodToApi(self.period_combo.currentText())
+        self.provider.fetchHistoricalBatch(metrics, period_api)
+
+    @staticmethod
+    def _mapTimeRange(text):
+        return _TIME_RANGE_API.get(text, "1d")
+
+    def _quantizedNow(self, time_range):
+        """Current epoch time rounded down to the time range's bucket"""
+        bucket = self.AS_OF_BUCKETS.get(time_range, 300)
+        return int(time.time()) // bucket * bucket
+
+    @staticmethod
+    def _mapTrainType(text):
+        return _TRAIN_TYPE_API.get(text, "all")
 
     @QtCore.pyqtSlot(dict)
     def onKpisUpdated(self, data):
-        self._provider_errors = 0
+        self._requestDone(kpis=True)
+        if self._provider_errors:
+            if self._provider_errors > 3:
+                self._hist_dirty = True
+                self._refresh_pending.start()
+            self._provider_errors = 0
+            self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        if not self.isVisible():
+            self._pending_kpis = data
+            return
         kpis = data.get("kpis", {})
-        trends = data.get("trends", {})
+        deltas = {key: _signedDelta(trend) for key, trend in data.get("trends", {}).items()}
+        # The server reports the punctuality trend under its 'rtp' alias
+        deltas.setdefault("punctuality", deltas.get("rtp"))
 
-        for tile_key, api_key, _title, unit in self.kpi_config:
-            if tile_key in self.kpi_tiles and api_key in kpis:
+        # Apply all tiles before Qt lays out and repaints any of them
+        self.setUpdatesEnabled(False)
+        try:
+            for api_key, tile_key, tile, color_fn in self._tile_updaters:
                 value = kpis.get(api_key)
-                # Trend delta
-                trend = trends.get(api_key) or trends.get(tile_key) or {}
-                change = trend.get("change")
-                delta = None
-                if isinstance(change, (int, float)):
-                    if trend.get("direction") == "DOWN":
-                        delta = -abs(change)
-                    elif trend.get("direction") == "UP":
-                        delta = abs(change)
-                    else:
-                        delta = change
-
-                tile = self.kpi_tiles[tile_key]
-                tile.unit_label.setText(unit)
-
-                # Minimal color rules per metric
-                if tile_key in ("punctuality", "headwayAdherence"):
-                    color = self.getKPIColor(value, 85 if tile_key == "punctuality" else 95,
-                                              75 if tile_key == "punctuality" else 90)
-                elif tile_key in ("averageDelay", "p90Delay", "mttrConflict", "openConflicts", "headwayBreaches"):
-                    thr = (6, 8) if tile_key == "averageDelay" else (12, 15) if tile_key == "p90Delay" else (5, 10)
-                    if tile_key in ("openConflicts", "headwayBreaches"):
-                        thr = (2, 4)
-                    color = self.getKPIColor(value, thr[0], thr[1], reverse=True)
-                elif tile_key in ("acceptanceRate",):
-                    color = self.getKPIColor(value, 70, 50)
-                elif tile_key in ("efficiency",):
-                    color = self.getKPIColor(value, 90, 80)
-                elif tile_key in ("performance",):
-                    color = self.getKPIColor(value, 80, 60)
-                else:
-                    color = "#495057"
-
-                self.updateKPITile(tile_key, value, delta, color)
+                if value is None:
+                    continue
+                delta = deltas.get(api_key)
+
+                # Most KPIs hold still between polls
+                state = (value, delta)
+                if self._last_tile_state.get(tile_key) == state:
+                    continue
+                self._last_tile_state[tile_key] = state
+                self._updateTile(tile, value, delta, color_fn(value))
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Update header timestamp if provided
         ts = data.get("timestamp") or data.get("time")
-        if isinstance(ts, str) and hasattr(self, "updated_label"):
+        if isinstance(ts, str):
             self.updated_label.setText(f"Updated: {ts}")
+            self.updated_label.setToolTip("")
 
     @QtCore.pyqtSlot(str, dict)
     def onHistoricalUpdated(self, metric, data):
-        try:
-            # Map alias 'rtp' to 'punctuality'
-            key = "punctuality" if metric in ("punctuality", "rtp") else metric
-            chart = self.charts_by_metric.get(key)
-            if chart is None:
+        if not self.isVisible():
+            self._pending_history[metric] = data
+            return
+        # Map alias 'rtp' to 'punctuality'
+        key = "punctuality" if metric in ("punctuality", "rtp") else metric
+        chart = self.charts_by_metric.get(key)
+        if chart is None or not isinstance(data, dict):
+            return
+        series = data.get("series") or data.get("data")
+        if not isinstance(series, list) or not series:
+            return
+
+        # Samples are kept as packed doubles, ready for the chart's point
+        # buffers; anything that is not a number is skipped
+        values = array('d', [
+            val for val in (item.get("v", item.get("value")) if isinstance(item, dict) else item
+                            for item in series)
+            if isinstance(val, (int, float))])
+        if not values:
+            return
+
+        i = _METRIC_IDX.get(key, -1)
+        label = _METRIC_NAMES[i] if i >= 0 else key
+        previous = self._last_series.get(key)
+        current = tuple(values)
+        if current == previous:
+            return
+        self._last_series[key] = current
+        tile = self.kpi_tiles.get(key)
+        if tile is not None:
+            tile.setTrend(values[-20:])
+        if previous is not None:
+            n = len(previous)
+            if len(current) > n and current[:n] == previous:
+                # New samples appended
+                chart.appendPoints(label, values[n:])
+                return
+            if len(current) == n:
+                # Full server window moving on by a few samples
+                for shift in range(1, min(n, 5)):
+                    if current[:n - shift] == previous[shift:]:
+                        chart.appendPoints(label, values[n - shift:], drop=shift)
+                        return
+                # Same shape: only rewrite the samples from the first change on
+                start = next(i for i, (old, new) in enumerate(zip(previous, current))
+                             if old != new)
+                chart.updateTail(label, values[start:])
                 return
 
-            series = data.get("series") or data.get("data") or []
-            values = []
-            for item in series:
-                if isinstance(item, dict):
-                    val = item.get("v")
-                    if val is None:
-                        val = item.get("value")
-                    if val is not None:
-                        values.append(val)
-                else:
-                    values.append(item)
-
-            if values:
-                chart.clearSeries()
-                meta = self.metric_meta.get(key, {"name": key})
-                label = meta.get("name", key)
-                chart.addSeries(label, values, QtGui.QColor(73, 80, 87))
-
-                # Optional target lines for certain metrics (minimal)
-                if key == "punctuality":
-                    target_line = [85] * len(values)
-                    chart.addSeries("Target (85%)", target_line, QtGui.QColor(134, 142, 150))
-        except Exception:
-            pass
+        chart.setUpdatesEnabled(False)
+        try:
+            chart.clearSeries()
+            chart.addSeries(label, values, self.SERIES_COLOR)
+        finally:
+            chart.setUpdatesEnabled(True)
+
+    @QtCore.pyqtSlot(dict)
+    def onHistoricalBatchUpdated(self, payload):
+        self._requestDone(hist=True)
+        for metric, data in payload.items():
+            self.onHistoricalUpdated(metric, data)
+
+    @QtCore.pyqtSlot(dict)
+    def onBundleUpdated(self, data):
+        """KPIs and historical series fetched together"""
+        self.onKpisUpdated(data)
+        self.onHistoricalBatchUpdated(data.get("historical") or {})
 
     @QtCore.pyqtSlot(str)
-    def onProviderError(self, message):
+    def onSnapshotReceived(self, timestamp):
+        """The server recorded new KPIs; hidden dashboards refresh on show"""
+        if self.isVisible():
+            self.requestDataRefresh()
+
+    @QtCore.pyqtSlot(bool)
+    def onStreamStatusChanged(self, live):
+        """Poll only while the snapshot stream is down"""
+        if live == self._stream_live:
+            return
+        self._stream_live = live
+        if live:
+            self.refresh_timer.stop()
+            if self.isVisible():
+                # Catch up on anything missed while polling was the fallback
+                self.requestDataRefresh()
+        elif self.isVisible():
+            self.refresh_timer.start()
+
+    @QtCore.pyqtSlot(str, str)
+    def onProviderError(self, kind, message):
         self._provider_errors += 1
+        # Only the failed request's guard is dropped; a bundle held both
+        self._requestDone(kpis=kind in ("kpis", "bundle"),
+                          hist=kind in ("history", "bundle"))
+        self._error_buffer.append(message)
+        if not self._error_flush_timer.isActive():
+            self._error_flush_timer.start()
+        # Back off instead of adding load while the server is failing
+        self.refresh_timer.setInterval(min(self.REFRESH_INTERVAL * 2 ** self._provider_errors,
+                                           self.MAX_REFRESH_INTERVAL))
         
+    def _flushErrors(self):
+        """Show the last error of a burst and how many there were"""
+        errors, self._error_buffer = self._error_buffer, []
+        if not errors:
+            return
+        # requests errors embed the whole URL; the tooltip keeps it
+        message = errors[-1]
+        text = f"Last error: {message[:60] + '...' if len(message) > 60 else message}"
+        if len(errors) > 1:
+            text += f" (x{len(errors)})"
+        self.updated_label.setText(text)
+        self.updated_label.setToolTip(message)
+
     def updateKPITile(self, key, value, delta, color):
         """Update a specific KPI tile"""
-        if key in self.kpi_tiles:
-            tile = self.kpi_tiles[key]
-            
-            # Format value based on type
-            if isinstance(value, float):
-                formatted_value = f"{value:.1f}" if value < 100 else f"{value:.0f}"
-            else:
-                formatted_value = str(int(value))
-                
-            # Minimal trend data (no mock randomness)
-            trend_data = [value] * 20
-            
-            tile.updateValue(formatted_value, delta, trend_data)
-            tile.setValueColor(color)
+        tile = self.kpi_tiles.get(key)
+        if tile is not None:
+            self._updateTile(tile, value, delta, color)
+
+    def _updateTile(self, tile, value, delta, color):
+        # Format value based on type
+        if isinstance(value, float):
+            formatted_value = f"{value:.1f}" if value < 100 else f"{value:.0f}"
+        else:
+            formatted_value = str(int(value))
+
+        # The sparkline follows the historical series, not the snapshot
+        tile.updateValue(formatted_value, delta)
+        tile.setValueColor(color)
+
+    @staticmethod
+    def _neutralKPIColor(value):
+        """Color for KPIs without thresholds"""
+        return "#495057"
             
     def getKPIColor(self, value, green_threshold, red_threshold, reverse=False):
         """Get modern color based on KPI thresholds"""
@@ -555,51 +885,65 @@ class RailwayKPIDashboard(QtWidgets.QWidget):
                     
     def exportReport(self):
         """Export comprehensive railway KPI report"""
+        now = datetime.now()
         file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self, "Export Railway KPI Report", 
-            f"Railway_Operations_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            f"Railway_Operations_Report_{now.strftime('%Y%m%d_%H%M%S')}.csv",
             "CSV files (*.csv)"
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w') as f:
-                    f.write("Railway Operations KPI Report\n")
-                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Time Range: {self.time_combo.currentText()}\n\n")
-                    
-                    f.write("Real-time Controller KPIs:\n")
-                    f.write("KPI,Current Value,Unit,Target,Status\n")
-                    
-                    # Export current KPI values with targets
-                    kpi_targets = {
-                        "punctuality": "≥85%",
-                        "averageDelay": "<6-8 min",
-                        "p90Delay": "<12-15 min",
-                        "throughput": "Contextual",
-                        "openConflicts": "≤2",
-                        "mttrConflict": "<5 min",
-                        "acceptanceRate": ">70%",
-                        "utilization": "≤60% (peak)",
-                        "efficiency": "≥90%",
-                        "performance": "≥80%",
-                        "headwayAdherence": "≥95%",
-                        "headwayBreaches": "≤2",
-                    }
-                    
-                    for key, tile in self.kpi_tiles.items():
-                        value = tile.value_label.text()
-                        unit = tile.unit_label.text()
-                        target = kpi_targets.get(key, "TBD")
-                        f.write(f"{tile.title},{value},{unit},{target},Active\n")
-                    
-                    f.write("\nGenerated by TS2 TrackTitans Railway Management System\n")
-                    
-                QtWidgets.QMessageBox.information(self, "Export Complete", 
-                    f"Railway operations report exported to:\n{file_path}")
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Export Error", 
-                    f"Failed to export report:\n{str(e)}")
+            # Export current KPI values with targets
+            kpi_targets = {
+                "punctuality": "≥85%",
+                "averageDelay": "<6-8 min",
+                "p90Delay": "<12-15 min",
+                "throughput": "Contextual",
+                "openConflicts": "≤2",
+                "mttrConflict": "<5 min",
+                "acceptanceRate": ">70%",
+                "utilization": "≤60% (peak)",
+                "efficiency": "≥90%",
+                "performance": "≥80%",
+                "headwayAdherence": "≥95%",
+                "headwayBreaches": "≤2",
+            }
+            rows = [
+                ["Railway Operations KPI Report"],
+                [f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"],
+                [f"Time Range: {self.time_combo.currentText()}"],
+                [],
+                ["Real-time Controller KPIs:"],
+                ["KPI", "Current Value", "Unit", "Target", "Status"],
+            ]
+            rows.extend([tile.title, tile.value_label.text(), tile.unit_label.text(),
+                         kpi_targets.get(key, "TBD"), "Active"]
+                        for key, tile in self.kpi_tiles.items())
+            rows.append([])
+            rows.append(["Generated by TS2 TrackTitans Railway Management System"])
+            # Rows are snapshotted above; the file is written off the GUI thread
+            self.export_btn.setEnabled(False)
+            self._export_executor.submit(self._writeReport, file_path, rows)
+
+    def _writeReport(self, file_path, rows):
+        """Write the report rows as CSV (runs on a worker thread)"""
+        try:
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f, lineterminator="\n").writerows(rows)
+        except Exception as e:
+            self.exportFailed.emit(str(e))
+        else:
+            self.exportFinished.emit(file_path)
+
+    def _onExportFinished(self, file_path):
+        self.export_btn.setEnabled(True)
+        QtWidgets.QMessageBox.information(self, "Export Complete", 
+            f"Railway operations report exported to:\n{file_path}")
+
+    def _onExportFailed(self, message):
+        self.export_btn.setEnabled(True)
+        QtWidgets.QMessageBox.critical(self, "Export Error", 
+            f"Failed to export report:\n{message}")
 
 
 # Alias for backward compatibility
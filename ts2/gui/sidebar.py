@@ -19,11 +19,67 @@
 #
 
 from Qt import QtCore, QtWidgets, Qt, QtGui, QtWebEngineWidgets, WEB_ENGINE_AVAILABLE
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 from ts2.utils import settings
 
 
+# Style sheet of the whole sidebar, set once on SidebarNavigation; the
+# navigation buttons pick their expanded or collapsed look from their
+# "collapsed" property instead of each parsing a sheet of their own
+_SIDEBAR_CSS = """
+    SidebarNavigation {
+        background-color: #f8f9fa;
+        border-right: 2px solid #dee2e6;
+    }
+    NavigationButton {
+        background-color: transparent;
+        border: none;
+        text-align: left;
+        padding: 8px 15px 8px 15px;
+        color: #495057;
+        font-size: 14px;
+        font-weight: 500;
+        border-radius: 6px;
+        margin: 2px 8px;
+    }
+    NavigationButton[collapsed="true"] {
+        text-align: center;
+        padding: 10px;
+        font-size: 16px;
+    }
+    NavigationButton:hover {
+        background-color: #e9ecef;
+    }
+    NavigationButton:checked {
+        background-color: #495057;
+        color: white;
+        border-left: 4px solid #343a40;
+    }
+"""
+
+# The toggle sits in the header, whose own sheet would take precedence over
+# rules inherited from the sidebar, so the toggle keeps a sheet of its own
+_TOGGLE_BTN_CSS = """
+    QPushButton {
+        background-color: transparent;
+        border: 1px solid #6c757d;
+        border-radius: 15px;
+        color: white;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+        border-color: #adb5bd;
+    }
+    QPushButton:pressed {
+        background-color: rgba(255, 255, 255, 0.2);
+    }
+"""
+
+
 class NavigationButton(QtWidgets.QPushButton):
     """Custom navigation button for sidebar"""
     
@@ -42,28 +98,8 @@ class NavigationButton(QtWidgets.QPushButton):
         # Connect to toggled signal to update icon color
         self.toggled.connect(self.updateIconColor)
         
-        # Style the button with proper icon spacing
-        self.setStyleSheet("""
-            NavigationButton {
-                background-color: transparent;
-                border: none;
-                text-align: left;
-                padding: 8px 15px 8px 15px;
-                color: #495057;
-                font-size: 14px;
-                font-weight: 500;
-                border-radius: 6px;
-                margin: 2px 8px;
-            }
-            NavigationButton:hover {
-                background-color: #e9ecef;
-            }
-            NavigationButton:checked {
-                background-color: #495057;
-                color: white;
-                border-left: 4px solid #343a40;
-            }
-        """)
+        # Styled by the sidebar's sheet, not polished yet
+        self.setProperty("collapsed", False)
         
     def setupIcon(self, icon_type):
         """Setup the icon based on type with custom drawn icons"""
@@ -231,55 +267,14 @@ class NavigationButton(QtWidgets.QPushButton):
         if collapsed:
             self.setText("")  # Hide text, show only icon
             self.setToolTip(self.original_text)
-            self.setStyleSheet("""
-                NavigationButton {
-                    background-color: transparent;
-                    border: none;
-                    text-align: center;
-                    padding: 10px;
-                    color: #495057;
-                    font-size: 16px;
-                    font-weight: 500;
-                    border-radius: 6px;
-                    margin: 2px 8px;
-                }
-                NavigationButton:hover {
-                    background-color: #e9ecef;
-                }
-                NavigationButton:checked {
-                    background-color: #495057;
-                    color: white;
-                    border-left: 4px solid #343a40;
-                }
-            """)
-            # Update icon color for collapsed state
-            self.updateIconColor()
         else:
             self.setText(self.original_text)  # Show text with icon
             self.setToolTip("")
-            self.setStyleSheet("""
-                NavigationButton {
-                    background-color: transparent;
-                    border: none;
-                    text-align: left;
-                    padding: 8px 15px 8px 15px;
-                    color: #495057;
-                    font-size: 14px;
-                    font-weight: 500;
-                    border-radius: 6px;
-                    margin: 2px 8px;
-                }
-                NavigationButton:hover {
-                    background-color: #e9ecef;
-                }
-                NavigationButton:checked {
-                    background-color: #495057;
-                    color: white;
-                    border-left: 4px solid #343a40;
-                }
-            """)
-            # Update icon color for expanded state
-            self.updateIconColor()
+        self.setProperty("collapsed", collapsed)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.updateIconColor()
 
 
 class SidebarNavigation(QtWidgets.QWidget):
@@ -311,12 +306,7 @@ class SidebarNavigation(QtWidgets.QWidget):
     def setupUI(self):
         """Setup the sidebar UI"""
         # Width will be set in __init__ after setupUI completes
-        self.setStyleSheet("""
-            SidebarNavigation {
-                background-color: #f8f9fa;
-                border-right: 2px solid #dee2e6;
-            }
-        """)
+        self.setStyleSheet(_SIDEBAR_CSS)
         
         # Main layout
         layout = QtWidgets.QVBoxLayout(self)
@@ -352,23 +342,7 @@ class SidebarNavigation(QtWidgets.QWidget):
         # Right side - Toggle button
         self.toggle_btn = QtWidgets.QPushButton("◀")
         self.toggle_btn.setFixedSize(30, 30)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #6c757d;
-                border-radius: 15px;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-color: #adb5bd;
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-        """)
+        self.toggle_btn.setStyleSheet(_TOGGLE_BTN_CSS)
         self.toggle_btn.clicked.connect(self.toggleCollapsed)
         header_layout.addWidget(self.toggle_btn)
         
@@ -492,6 +466,62 @@ class SidebarNavigation(QtWidgets.QWidget):
             self.connection_status.setStyleSheet("color: #dc3545; font-size: 12px;")
 
 
+# Leaflet page for the OpenRailwayMap tab, centred over the Bhopal area
+# (23.2703, 77.403) at ~11.62 zoom
+_LEAFLET_HTML = """<!DOCTYPE html>
+<html lang=\"en\">
+  <head>
+    <meta charset=\"utf-8\">
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
+    <title>OpenRailwayMap Embedded</title>
+    <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"anonymous\" />
+    <style>
+      html, body, #map { height: 100%; width: 100%; margin: 0; padding: 0; }
+      .leaflet-container { background: #f1f3f5; }
+      /* Ensure overlay pane sits above base and remains colorful */
+      .leaflet-pane.leaflet-overlay-pane { z-index: 400 !important; }
+      .leaflet-pane.base-pane { z-index: 200 !important; filter: grayscale(1) brightness(0.9) contrast(1.05); }
+      .leaflet-pane.overlay-pane { z-index: 450 !important; filter: saturate(1.25) contrast(1.1); }
+    </style>
+  </head>
+  <body>
+    <div id=\"map\"></div>
+    <script src=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"anonymous\"></script>
+    <script>
+      (function() {
+        var map = L.map('map', { zoomSnap: 0.25, preferCanvas: true, zoomControl: true });
+        map.setView([__LAT__, __LNG__], __ZOOM__);
+
+        // Create separate panes so we can style base vs overlay differently
+        map.createPane('base');
+        map.getPane('base').classList.add('base-pane');
+        map.createPane('rail');
+        map.getPane('rail').classList.add('overlay-pane');
+
+        // Base map (lightweight OSM tiles), dimmed and desaturated via CSS filter on pane
+        var osm = L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+          maxZoom: 20,
+          detectRetina: true,
+          pane: 'base',
+          opacity: 0.85,
+          attribution: '&copy; OpenStreetMap contributors'
+        }).addTo(map);
+
+        // OpenRailwayMap overlay (tracks), boosted saturation/contrast via pane styling
+        var orm = L.tileLayer('https://{s}.tiles.openrailwaymap.org/standard/{z}/{x}/{y}.png', {
+          maxZoom: 20,
+          detectRetina: true,
+          pane: 'rail',
+          opacity: 1.0,
+          attribution: '&copy; OpenRailwayMap contributors'
+        }).addTo(map);
+      })();
+    </script>
+  </body>
+</html>
+""".replace("__LAT__", "23.2703").replace("__LNG__", "77.403").replace("__ZOOM__", "11.62")
+
+
 class MapOverviewWidget(QtWidgets.QWidget):
     """Interactive map overview showing OpenRailwayMap"""
     
@@ -500,14 +530,27 @@ class MapOverviewWidget(QtWidgets.QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # WebEngine views are only created once the map is first shown
+        self._map_initialized = False
         self.setupUI()
         
     def setupUI(self):
-        """Setup map overview UI with tabbed interface for different maps"""
+        """Setup the map overview layout; see ensureMapLoaded for the maps"""
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(5)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.ensureMapLoaded()
+
+    def ensureMapLoaded(self):
+        """Build the tabbed map views (or the browser fallback) on first use"""
+        if self._map_initialized:
+            return
+        self._map_initialized = True
+        layout = self.layout()
+
         if WEB_ENGINE_AVAILABLE:
             # Check Qt WebEngine version
             try:
@@ -757,61 +800,7 @@ class MapOverviewWidget(QtWidgets.QWidget):
         
     def generateLeafletHtml(self):
         """Return minimal HTML embedding Leaflet with OpenRailwayMap overlay only."""
-        # Center over Bhopal area (23.2703, 77.403) with ~11.62 zoom as requested
-        html = """<!DOCTYPE html>
-<html lang=\"en\">
-  <head>
-    <meta charset=\"utf-8\">
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
-    <title>OpenRailwayMap Embedded</title>
-    <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"anonymous\" />
-    <style>
-      html, body, #map { height: 100%; width: 100%; margin: 0; padding: 0; }
-      .leaflet-container { background: #f1f3f5; }
-      /* Ensure overlay pane sits above base and remains colorful */
-      .leaflet-pane.leaflet-overlay-pane { z-index: 400 !important; }
-      .leaflet-pane.base-pane { z-index: 200 !important; filter: grayscale(1) brightness(0.9) contrast(1.05); }
-      .leaflet-pane.overlay-pane { z-index: 450 !important; filter: saturate(1.25) contrast(1.1); }
-    </style>
-  </head>
-  <body>
-    <div id=\"map\"></div>
-    <script src=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"anonymous\"></script>
-    <script>
-      (function() {
-        var map = L.map('map', { zoomSnap: 0.25, preferCanvas: true, zoomControl: true });
-        map.setView([__LAT__, __LNG__], __ZOOM__);
-
-        // Create separate panes so we can style base vs overlay differently
-        map.createPane('base');
-        map.getPane('base').classList.add('base-pane');
-        map.createPane('rail');
-        map.getPane('rail').classList.add('overlay-pane');
-
-        // Base map (lightweight OSM tiles), dimmed and desaturated via CSS filter on pane
-        var osm = L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
-          maxZoom: 20,
-          detectRetina: true,
-          pane: 'base',
-          opacity: 0.85,
-          attribution: '&copy; OpenStreetMap contributors'
-        }).addTo(map);
-
-        // OpenRailwayMap overlay (tracks), boosted saturation/contrast via pane styling
-        var orm = L.tileLayer('https://{s}.tiles.openrailwaymap.org/standard/{z}/{x}/{y}.png', {
-          maxZoom: 20,
-          detectRetina: true,
-          pane: 'rail',
-          opacity: 1.0,
-          attribution: '&copy; OpenRailwayMap contributors'
-        }).addTo(map);
-      })();
-    </script>
-  </body>
-</html>
-"""
-        html = html.replace("__LAT__", "23.2703").replace("__LNG__", "77.403").replace("__ZOOM__", "11.62")
-        return html
+        return _LEAFLET_HTML
         
     def openOnlineMap(self):
         """Open OpenRailwayMap in external browser"""
@@ -998,12 +987,56 @@ class MapOverviewWidget(QtWidgets.QWidget):
             self.railway_map_view.load(url)
 
 
+def _trainStatusColors(status):
+    """Train table status cell (foreground, background or None)"""
+    status = status.upper()
+    if status in ('RUNNING', 'ON TIME', 'ACTIVE'):
+        return "#10b981", "#ecfdf5"  # Green
+    if status in ('DELAYED', 'WARNING'):
+        return "#f59e0b", "#fffbeb"  # Amber
+    if status in ('ERROR', 'EMERGENCY'):
+        return "#ef4444", "#fef2f2"  # Red
+    return "#6b7280", None  # Gray, also for STOPPED/HALTED
+
+
+def _trainSpeedColors(speed):
+    if speed > 80:
+        return "#ef4444", None  # Red for high speed
+    if speed > 40:
+        return "#f59e0b", None  # Amber for medium speed
+    return "#10b981", None  # Green for low speed
+
+
+def _trainDelayColors(delay):
+    if delay > 10:
+        return "#ef4444", "#fef2f2"  # Red for major delay
+    if delay > 5:
+        return "#f59e0b", "#fffbeb"  # Amber for moderate delay
+    if delay <= 0:
+        return "#10b981", "#ecfdf5"  # Green for on time/early
+    return "#6b7280", None  # Gray for minor delay
+
+
 class TrainManagementWidget(QtWidgets.QWidget):
     """Comprehensive train management system"""
+
+    # Results of the HTTP calls made on the worker pool, delivered on the
+    # GUI thread
+    trainsLoaded = QtCore.pyqtSignal(list)
+    trainsLoadFailed = QtCore.pyqtSignal()
+    routeActionDone = QtCore.pyqtSignal(str, str)
+    routeActionFailed = QtCore.pyqtSignal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="train-mgmt")
+        self.trainsLoaded.connect(self._onTrainsLoaded)
+        self.trainsLoadFailed.connect(self.loadDummyData)
+        self.routeActionDone.connect(self._onRouteActionDone)
+        self.routeActionFailed.connect(self._onRouteActionFailed)
         self.trains_data = []
+        self._row_ids = []  # train id shown in each table row
+        self._monospace = QtGui.QFont("monospace")
         self._base_url = "http://localhost:22222"
         self._session = None
         self.selected_train = None
@@ -1029,6 +1062,15 @@ class TrainManagementWidget(QtWidgets.QWidget):
         left_layout.addWidget(trains_label)
         
         self.trains_table = self._create_enhanced_table()
+        self.trains_table.setColumnCount(4)
+        self.trains_table.setHorizontalHeaderLabels(["Train ID", "Status", "Speed", "Delay"])
+        # Enhanced column sizing for better readability
+        header = self.trains_table.horizontalHeader()
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)  # Train ID
+        header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)  # Status (expandable)
+        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)  # Speed
+        header.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeToContents)  # Delay
+        header.setStretchLastSection(False)  # Manual control
         self.trains_table.selectionModel().selectionChanged.connect(self.onTrainSelected)
         # Ensure table expands within its panel
         self.trains_table.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
@@ -1186,78 +1228,55 @@ class TrainManagementWidget(QtWidgets.QWidget):
             
     @QtCore.pyqtSlot()
     def updateTrainsTable(self):
-        """Update the trains table with enhanced styling"""
-        self.trains_table.setRowCount(len(self.trains_data))
-        self.trains_table.setColumnCount(4)
-        self.trains_table.setHorizontalHeaderLabels(["Train ID", "Status", "Speed", "Delay"])
-        
-        for row, train in enumerate(self.trains_data):
-            # Train ID with monospace
-            id_item = QtWidgets.QTableWidgetItem(train['id'])
-            id_item.setFont(QtGui.QFont("monospace"))
-            self.trains_table.setItem(row, 0, id_item)
-            
-            # Status with color coding
-            status_text = train['status']
-            status_item = QtWidgets.QTableWidgetItem(status_text)
-            status_item.font().setBold(True)
-            
-            if status_text.upper() in ['RUNNING', 'ON TIME', 'ACTIVE']:
-                status_item.setForeground(QtGui.QColor("#10b981"))  # Green
-                status_item.setBackground(QtGui.QColor("#ecfdf5"))
-            elif status_text.upper() in ['DELAYED', 'WARNING']:
-                status_item.setForeground(QtGui.QColor("#f59e0b"))  # Amber
-                status_item.setBackground(QtGui.QColor("#fffbeb"))
-            elif status_text.upper() in ['STOPPED', 'HALTED']:
-                status_item.setForeground(QtGui.QColor("#6b7280"))  # Gray
-            elif status_text.upper() in ['ERROR', 'EMERGENCY']:
-                status_item.setForeground(QtGui.QColor("#ef4444"))  # Red
-                status_item.setBackground(QtGui.QColor("#fef2f2"))
-            else:
-                status_item.setForeground(QtGui.QColor("#6b7280"))  # Default gray
-                
-            self.trains_table.setItem(row, 1, status_item)
-            
-            # Speed with color coding and monospace
-            speed = train.get('speed', 0)
-            speed_item = QtWidgets.QTableWidgetItem(f"{speed} km/h")
-            speed_item.setFont(QtGui.QFont("monospace"))
-            
-            if speed > 80:
-                speed_item.setForeground(QtGui.QColor("#ef4444"))  # Red for high speed
-            elif speed > 40:
-                speed_item.setForeground(QtGui.QColor("#f59e0b"))  # Amber for medium speed
-            else:
-                speed_item.setForeground(QtGui.QColor("#10b981"))  # Green for low speed
-                
-            self.trains_table.setItem(row, 2, speed_item)
-            
-            # Delay with color coding
-            delay = train.get('delay', 0)
-            delay_item = QtWidgets.QTableWidgetItem(f"{delay} min")
-            delay_item.setFont(QtGui.QFont("monospace"))
-            
-            if delay > 10:
-                delay_item.setForeground(QtGui.QColor("#ef4444"))  # Red for major delay
-                delay_item.setBackground(QtGui.QColor("#fef2f2"))
-            elif delay > 5:
-                delay_item.setForeground(QtGui.QColor("#f59e0b"))  # Amber for moderate delay
-                delay_item.setBackground(QtGui.QColor("#fffbeb"))
-            elif delay <= 0:
-                delay_item.setForeground(QtGui.QColor("#10b981"))  # Green for on time/early
-                delay_item.setBackground(QtGui.QColor("#ecfdf5"))
+        """Update the trains table in place, keyed by train id"""
+        incoming = {train['id']: train for train in self.trains_data}
+        table = self.trains_table
+        # Refill without a layout or repaint per cell
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            # Drop the rows of trains that are gone, bottom-up so the
+            # remaining indexes (and the selection) stay valid
+            for row in reversed(range(len(self._row_ids))):
+                if self._row_ids[row] not in incoming:
+                    table.removeRow(row)
+                    del self._row_ids[row]
+            known = set(self._row_ids)
+            self._row_ids.extend(train_id for train_id in incoming if train_id not in known)
+            table.setRowCount(len(self._row_ids))
+            for row, train_id in enumerate(self._row_ids):
+                self._updateTrainRow(row, incoming[train_id])
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+        # Keep trains_data in table order for onTrainSelected
+        self.trains_data = [incoming[train_id] for train_id in self._row_ids]
+
+    def _updateTrainRow(self, row, train):
+        """Set the cells of one row, touching only those whose text changed"""
+        speed = train.get('speed', 0)
+        delay = train.get('delay', 0)
+        cells = (
+            (train['id'], None),
+            (train['status'], _trainStatusColors(train['status'])),
+            (f"{speed} km/h", _trainSpeedColors(speed)),
+            (f"{delay} min", _trainDelayColors(delay)),
+        )
+        for col, (text, colors) in enumerate(cells):
+            item = self.trains_table.item(row, col)
+            if item is None:
+                item = QtWidgets.QTableWidgetItem(text)
+                if col != 1:
+                    item.setFont(self._monospace)
+                self.trains_table.setItem(row, col, item)
+            elif item.text() == text:
+                continue
             else:
-                delay_item.setForeground(QtGui.QColor("#6b7280"))  # Gray for minor delay
-                
-            self.trains_table.setItem(row, 3, delay_item)
-            
-        # Enhanced column sizing for better readability
-        header = self.trains_table.horizontalHeader()
-        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)  # Train ID
-        header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)  # Status (expandable)
-        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)  # Speed
-        header.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeToContents)  # Delay
-        header.setStretchLastSection(False)  # Manual control
+                item.setText(text)
+            if colors is not None:
+                foreground, background = colors
+                item.setForeground(QtGui.QColor(foreground))
+                item.setBackground(QtGui.QColor(background) if background else QtGui.QBrush())
         
     def onTrainSelected(self):
         """Handle train selection"""
@@ -1330,7 +1349,6 @@ class TrainManagementWidget(QtWidgets.QWidget):
 
     def loadTrainsFromApi(self, section_id=None):
         """Fetch current trains for a section from the server API with fallback to dummy data."""
-        import threading
 
         def _run():
             try:
@@ -1340,19 +1358,21 @@ class TrainManagementWidget(QtWidgets.QWidget):
                 resp.raise_for_status()
                 data = resp.json()
                 trains = data.get('currentTrains') or data.get('trains') or []
-                self.trains_data = trains
-                QtCore.QMetaObject.invokeMethod(self, "updateTrainsTable", Qt.QueuedConnection)
+                self.trainsLoaded.emit(trains)
             except Exception as e:
                 print(f"Error loading trains from API: {e}, falling back to dummy data")
                 # Fallback to dummy data
-                QtCore.QMetaObject.invokeMethod(self, "loadDummyData", Qt.QueuedConnection)
+                self.trainsLoadFailed.emit()
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._executor.submit(_run)
+
+    def _onTrainsLoaded(self, trains):
+        self.trains_data = trains
+        self.updateTrainsTable()
 
     def _post_route_action(self, action, new_route=None, reason=None):
         if not self.selected_train:
             return
-        import threading
         body = {"action": action}
         if new_route:
             body["newRoute"] = new_route
@@ -1364,13 +1384,19 @@ class TrainManagementWidget(QtWidgets.QWidget):
                 url = f"{self._base_url}/api/trains/{train_id}/route"
                 resp = self._http().post(url, json=body, timeout=5)
                 resp.raise_for_status()
-                self.loadTrainsFromApi()
-                QtWidgets.QMessageBox.information(self, "Success", f"Action {action} sent for train {train_id}")
+                self.routeActionDone.emit(action, str(train_id))
             except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Failed to send action: {e}")
+                self.routeActionFailed.emit(str(e))
 
         train_id = self.selected_train.get('id') or self.selected_train.get('trainId')
-        threading.Thread(target=_run, args=(train_id,), daemon=True).start()
+        self._executor.submit(_run, train_id)
+
+    def _onRouteActionDone(self, action, train_id):
+        self.loadTrainsFromApi()
+        QtWidgets.QMessageBox.information(self, "Success", f"Action {action} sent for train {train_id}")
+
+    def _onRouteActionFailed(self, message):
+        QtWidgets.QMessageBox.critical(self, "Error", f"Failed to send action: {message}")
 
     def onAcceptRoute(self):
         self._post_route_action("ACCEPT")
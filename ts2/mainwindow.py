@@ -212,7 +212,6 @@ class MainWindow(QtWidgets.QMainWindow):
         header_layout.addWidget(self.modern_header)
         
         # Store references for compatibility
-        self.scoreDisplay = self.modern_header.score_display
         self.clockWidget = self.modern_header.clock_widget
         self.buttPause = self.modern_header.pause_btn
         self.zoomWidget = self.modern_header.zoom_widget
@@ -882,7 +881,6 @@ class MainWindow(QtWidgets.QMainWindow):
             self.simulation.scorer.scoreChanged.disconnect()
         except TypeError:
             pass
-        self.scoreDisplay.display(0)
         try:
             self.simulation.timeFactorChanged.disconnect()
         except TypeError:
@@ -1153,10 +1151,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.modern_header.setControlsEnabled(not state)
             
         # Handle editor action separately
-        if not state and self.fileName:
-            self.modern_header.edit_btn.setEnabled(True)
-        else:
-            self.modern_header.edit_btn.setEnabled(False)
+        self.modern_header.setEditEnabled(not state and bool(self.fileName))
 
     def openSettingsDialog(self):
         d = settingsdialog.SettingsDialog(self)